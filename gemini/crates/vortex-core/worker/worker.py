@@ -16,17 +16,29 @@ import json
 import logging
 import mmap
 import os
+import queue
 import signal
 import socket
 import struct
 import sys
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Optional compute backend, imported once rather than per job
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    torch = None
+    TORCH_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -55,28 +67,83 @@ class WorkerStatus(IntEnum):
 # IPC Protocol (matching ipc.rs)
 # ============================================================================
 
+# Little-endian u32 length prefix on every packet (ipc.rs)
+_LEN_STRUCT = struct.Struct('<I')
+
+# The host decodes packets with serde_json (ipc.rs), so the body must stay
+# JSON. The fastest installed C codec is used (msgspec, then orjson);
+# VORTEX_IPC_CODEC=json forces the stdlib codec (e.g. for debugging).
+_std_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+_std_decoder = json.JSONDecoder()
+
+
+def _std_encode(obj: Any) -> bytes:
+    return _std_encoder.encode(obj).encode('utf-8')
+
+
+def _std_decode(body) -> Any:
+    return _std_decoder.decode(str(body, 'utf-8'))
+
+
+IPC_CODEC = os.environ.get('VORTEX_IPC_CODEC', 'auto')
+
+msgspec = None
+orjson = None
+if IPC_CODEC != 'json':
+    try:
+        import msgspec
+    except ImportError:
+        try:
+            import orjson
+        except ImportError:
+            pass
+
+if msgspec is not None:
+    _json_encode = msgspec.json.Encoder().encode
+    _json_decode = msgspec.json.Decoder().decode
+elif orjson is not None:
+    _json_encode = orjson.dumps
+    _json_decode = orjson.loads
+else:
+    _json_encode = _std_encode
+    _json_decode = _std_decode
+
+
 @dataclass
 class ControlPacket:
     request_id: str
     timestamp: int
     payload: Dict[str, Any]
     
-    def to_bytes(self) -> bytes:
-        data = json.dumps({
+    def body_bytes(self) -> bytes:
+        """Encode the packet body (without the length prefix)"""
+        return _json_encode({
             "request_id": self.request_id,
             "timestamp": self.timestamp,
             "payload": self.payload
-        }).encode('utf-8')
-        return struct.pack('<I', len(data)) + data
+        })
+    
+    def frame(self) -> Tuple[bytes, bytes]:
+        """(length prefix, body) as separate buffers for a gather write"""
+        body = self.body_bytes()
+        return _LEN_STRUCT.pack(len(body)), body
+    
+    def to_bytes(self) -> bytes:
+        return b''.join(self.frame())
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'ControlPacket':
-        length = struct.unpack('<I', data[:4])[0]
-        payload = json.loads(data[4:4+length])
+        length = _LEN_STRUCT.unpack_from(data, 0)[0]
+        return cls.from_body(memoryview(data)[4:4+length])
+    
+    @classmethod
+    def from_body(cls, body) -> 'ControlPacket':
+        """Decode a packet body (without the length prefix)"""
+        packet = _json_decode(body)
         return cls(
-            request_id=payload['request_id'],
-            timestamp=payload['timestamp'],
-            payload=payload['payload']
+            request_id=packet['request_id'],
+            timestamp=packet['timestamp'],
+            payload=packet['payload']
         )
 
 
@@ -87,22 +154,145 @@ def recv_packet(sock: socket.socket) -> ControlPacket:
     if len(len_data) < 4:
         raise ConnectionError("Connection closed")
     
-    length = struct.unpack('<I', len_data)[0]
+    length = _LEN_STRUCT.unpack(len_data)[0]
     
-    # Read payload
-    payload = b''
-    while len(payload) < length:
-        chunk = sock.recv(length - len(payload))
-        if not chunk:
+    # Read payload straight into a preallocated buffer
+    payload = bytearray(length)
+    view = memoryview(payload)
+    received = 0
+    while received < length:
+        n = sock.recv_into(view[received:])
+        if not n:
             raise ConnectionError("Connection closed")
-        payload += chunk
+        received += n
+    
+    return ControlPacket.from_body(payload)
+
+
+# Initial receive buffer; grows to fit the largest packet seen
+RECV_BUFFER_SIZE = 64 * 1024
+
+
+class PacketReader:
+    """Buffered packet reader: one recv_into() can yield many packets"""
     
-    return ControlPacket.from_bytes(len_data + payload)
+    def __init__(self, sock: socket.socket, bufsize: int = RECV_BUFFER_SIZE):
+        self.sock = sock
+        self._buf = bytearray(bufsize)
+        self._view = memoryview(self._buf)
+        self._start = 0  # First unconsumed byte
+        self._end = 0  # End of received data
+    
+    def has_packet(self) -> bool:
+        """True if a complete packet is already buffered"""
+        avail = self._end - self._start
+        if avail < 4:
+            return False
+        length = _LEN_STRUCT.unpack_from(self._buf, self._start)[0]
+        return avail >= 4 + length
+    
+    def read_packet(self) -> ControlPacket:
+        """Return the next packet, receiving only when none is buffered"""
+        while not self.has_packet():
+            self._fill()
+        length = _LEN_STRUCT.unpack_from(self._buf, self._start)[0]
+        body_start = self._start + 4
+        self._start = body_start + length
+        return ControlPacket.from_body(self._view[body_start:self._start])
+    
+    def _fill(self):
+        """Receive as much as the socket has ready into the buffer"""
+        pending = self._end - self._start
+        needed = 4
+        if pending >= 4:
+            needed += _LEN_STRUCT.unpack_from(self._buf, self._start)[0]
+        
+        if needed > len(self._buf):
+            # Grow to fit this packet
+            buf = bytearray(max(needed, 2 * len(self._buf)))
+            buf[:pending] = self._view[self._start:self._end]
+            self._buf, self._view = buf, memoryview(buf)
+            self._start, self._end = 0, pending
+        elif self._start + needed > len(self._buf) or not pending:
+            # Move the partial packet to the front
+            self._buf[:pending] = bytes(self._view[self._start:self._end])
+            self._start, self._end = 0, pending
+        
+        n = self.sock.recv_into(self._view[self._end:])
+        if not n:
+            raise ConnectionError("Connection closed")
+        self._end += n
 
 
 def send_packet(sock: socket.socket, packet: ControlPacket):
-    """Send a length-prefixed packet"""
-    sock.sendall(packet.to_bytes())
+    """Send a length-prefixed packet without joining prefix and body"""
+    send_buffers(sock, packet.frame())
+
+
+# Linux caps a single sendmsg() at IOV_MAX (1024) iovecs
+MAX_IOVECS = 1024
+
+
+def send_buffers(sock: socket.socket, buffers: Sequence[Any]):
+    """Send several buffers, one gather write (sendmsg) per IOV_MAX chunk"""
+    if not hasattr(sock, 'sendmsg'):
+        for buf in buffers:
+            sock.sendall(buf)
+        return
+    
+    views = [memoryview(buf) for buf in buffers]
+    start = 0
+    while start < len(views):
+        sent = sock.sendmsg(views[start:start + MAX_IOVECS])
+        # Skip fully written buffers and trim a partially written one
+        while start < len(views) and sent >= len(views[start]):
+            sent -= len(views[start])
+            start += 1
+        if sent:
+            views[start] = views[start][sent:]
+
+
+# Reusable serialization arena for queued outgoing packets
+SEND_ARENA_SIZE = 256 * 1024
+
+
+class PacketQueue:
+    """Outgoing packets framed into a reusable arena, written once per flush"""
+    
+    def __init__(self, sock: socket.socket, arena_size: int = SEND_ARENA_SIZE):
+        self.sock = sock
+        self._arena = bytearray(arena_size)
+        self._used = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def push(self, packet: ControlPacket):
+        """Queue a packet; nothing is written until flush()"""
+        body = packet.body_bytes()
+        end = self._used + 4 + len(body)
+        if end > len(self._arena):
+            self.flush()
+            end = 4 + len(body)
+            if end > len(self._arena):
+                # Larger than the arena: write it on its own
+                send_buffers(self.sock, (_LEN_STRUCT.pack(len(body)), body))
+                return
+        
+        _LEN_STRUCT.pack_into(self._arena, self._used, len(body))
+        self._arena[self._used + 4:end] = body
+        self._used = end
+        self._count += 1
+    
+    def flush(self):
+        """Write every queued packet"""
+        if not self._used:
+            return
+        with memoryview(self._arena) as view:
+            self.sock.sendall(view[:self._used])
+        self._used = 0
+        self._count = 0
 
 
 # ============================================================================
@@ -149,22 +339,50 @@ class PassthroughExecutor(Executor):
         return None
 
 
+# Compile hot CUDA kernels with torch.compile (first call per shape is slow)
+TORCH_COMPILE = os.environ.get('VORTEX_TORCH_COMPILE', '').lower() in ('1', 'true')
+
+
+def _add(x: Any, y: Any) -> Any:
+    return x + y
+
+
 class AddExecutor(Executor):
     """Add two tensors"""
     
+    # (device, dtype, shape) -> compiled kernel, shared by all instances
+    _compiled: Dict[tuple, Any] = {}
+    
     def execute(self, inputs: Dict[str, Any], params: Dict[str, Any]) -> Any:
-        try:
-            import torch
-            a = inputs.get('a')
-            b = inputs.get('b')
-            if a is not None and b is not None:
-                return torch.add(a, b)
-            return a or b
-        except ImportError:
+        if not TORCH_AVAILABLE:
             # Fallback for non-PyTorch
-            a = inputs.get('a', 0)
-            b = inputs.get('b', 0)
-            return a + b
+            return inputs.get('a', 0) + inputs.get('b', 0)
+        a = inputs.get('a')
+        b = inputs.get('b')
+        if a is None or b is None:
+            return a if a is not None else b
+        if TORCH_COMPILE and isinstance(a, torch.Tensor) and a.is_cuda:
+            return self._compiled_add(a, b)
+        return torch.add(a, b)
+    
+    def _compiled_add(self, a: Any, b: Any) -> Any:
+        """Add via a kernel compiled for these operands, falling back to torch.add"""
+        key = (a.device, a.dtype, tuple(a.shape), getattr(b, 'dtype', None),
+               tuple(getattr(b, 'shape', ())))
+        kernel = self._compiled.get(key)
+        if kernel is not None:
+            return kernel(a, b)
+        
+        # Compilation happens on the first call
+        try:
+            kernel = torch.compile(_add, mode='reduce-overhead', dynamic=False)
+            result = kernel(a, b)
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager add: {e}")
+            kernel = torch.add
+            result = torch.add(a, b)
+        self._compiled[key] = kernel
+        return result
 
 
 # Executor registry
@@ -182,10 +400,36 @@ def get_executor(op_type: str) -> Optional[Executor]:
     return None
 
 
+@lru_cache(maxsize=None)
+def detect_capabilities() -> List[str]:
+    """Detect available capabilities (CUDA, etc.), probed once per process"""
+    caps = []
+    
+    if TORCH_AVAILABLE:
+        if torch.cuda.is_available():
+            caps.append("CUDA")
+            caps.append(f"GPU:{torch.cuda.get_device_name(0)}")
+        if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+            caps.append("MPS")
+        caps.append("TORCH")
+    
+    try:
+        import numpy
+        caps.append("NUMPY")
+    except ImportError:
+        pass
+    
+    return caps
+
+
 # ============================================================================
 # Shared Memory Access (SRS Section 3.5.2)
 # ============================================================================
 
+# Leading ShmHeader fields (shm.rs): magic u64, version u32
+_SHM_HEADER = struct.Struct('<QI')
+
+
 class SharedMemoryAccess:
     """Zero-Copy access to shared memory"""
     
@@ -223,14 +467,58 @@ class SharedMemoryAccess:
             logger.warning(f"Failed to open SHM: {e}")
             self.mm = None
     
+    def view(self, offset: int, nbytes: int) -> memoryview:
+        """Zero-copy view of a region of the mapping"""
+        if not self.mm:
+            raise RuntimeError("Shared memory is not mapped")
+        if offset < 0 or nbytes < 0 or offset + nbytes > len(self.mm):
+            raise ValueError(f"Region [{offset}, {offset + nbytes}) is outside shared memory")
+        return memoryview(self.mm)[offset:offset + nbytes]
+    
+    def tensor(self, offset: int, shape: List[int], dtype: str) -> Any:
+        """Tensor aliasing shared memory directly (no copy)"""
+        if not TORCH_AVAILABLE:
+            raise RuntimeError("PyTorch is required for SHM tensors")
+        
+        torch_dtype = getattr(torch, dtype, None)
+        if not isinstance(torch_dtype, torch.dtype):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        
+        numel = 1
+        for dim in shape:
+            numel *= dim
+        itemsize = torch.empty((), dtype=torch_dtype).element_size()
+        
+        # The mapping is writable, so frombuffer aliases it instead of copying
+        region = self.view(offset, numel * itemsize)
+        return torch.frombuffer(region, dtype=torch_dtype, count=numel).reshape(shape)
+    
+    def offset_of(self, value: Any) -> Optional[int]:
+        """SHM offset of a CPU tensor whose storage lies in the mapping, else None"""
+        if not self.mm or not TORCH_AVAILABLE or not isinstance(value, torch.Tensor):
+            return None
+        if value.device.type != 'cpu' or not value.is_contiguous():
+            return None
+        
+        import ctypes
+        
+        # Temporary export just to learn the mapping's base address
+        anchor = ctypes.c_char.from_buffer(self.mm)
+        base = ctypes.addressof(anchor)
+        del anchor
+        
+        offset = value.data_ptr() - base
+        nbytes = value.numel() * value.element_size()
+        if 0 <= offset and offset + nbytes <= len(self.mm):
+            return offset
+        return None
+    
     def read_header(self) -> Dict[str, Any]:
         """Read the shared memory header"""
         if not self.mm:
             return {}
         
-        self.mm.seek(0)
-        magic = struct.unpack('<Q', self.mm.read(8))[0]
-        version = struct.unpack('<I', self.mm.read(4))[0]
+        magic, version = _SHM_HEADER.unpack_from(self.mm, 0)
         
         return {
             'magic': hex(magic),
@@ -241,11 +529,74 @@ class SharedMemoryAccess:
     def close(self):
         """Close the mapping"""
         if self.mm:
-            self.mm.close()
+            try:
+                self.mm.close()
+            except BufferError:
+                # Tensors still alias the mapping; it is released with them
+                logger.warning("SHM views still alive, leaving mapping open")
+            self.mm = None
         if self.fd is not None:
             os.close(self.fd)
 
 
+# Max packets handled per batch before queued replies are flushed
+REPLY_BATCH_SIZE = max(1, int(os.environ.get('VORTEX_BATCH_HEARTBEATS', '16')))
+
+
+# ============================================================================
+# Pending Job Tracking
+# ============================================================================
+
+class PendingJobs:
+    """Jobs received but not yet started, stored column-wise.
+    
+    Each field lives in its own contiguous column (job ids, receive times,
+    cancel flags) so scans touch only the column they need. Shared between
+    the receive thread and the main loop, hence the lock.
+    """
+    
+    def __init__(self):
+        self.job_ids: List[str] = []
+        self.received_ns = array('q')
+        self.cancelled = bytearray()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.job_ids)
+    
+    def add(self, job_id: str):
+        with self._lock:
+            self.job_ids.append(job_id)
+            self.received_ns.append(time.perf_counter_ns())
+            self.cancelled.append(0)
+    
+    def cancel(self, job_id: str) -> bool:
+        """Flag a pending job as cancelled; False if it is not pending"""
+        with self._lock:
+            try:
+                idx = self.job_ids.index(job_id)
+            except ValueError:
+                return False
+            self.cancelled[idx] = 1
+            return True
+    
+    def pop(self, job_id: str) -> Optional[Tuple[bool, int]]:
+        """Remove a job, returning (cancelled, receive time ns) or None"""
+        with self._lock:
+            try:
+                idx = self.job_ids.index(job_id)
+            except ValueError:
+                return None
+            entry = (bool(self.cancelled[idx]), self.received_ns[idx])
+            # Swap-remove keeps every column dense
+            last = len(self.job_ids) - 1
+            self.job_ids[idx] = self.job_ids[last]
+            self.received_ns[idx] = self.received_ns[last]
+            self.cancelled[idx] = self.cancelled[last]
+            del self.job_ids[last], self.received_ns[last], self.cancelled[last]
+            return entry
+
+
 # ============================================================================
 # Worker Main Loop (SRS Section 3.10 - Worker Execution Flow)
 # ============================================================================
@@ -258,6 +609,17 @@ class Worker:
         self.socket_path = socket_path
         self.shm_name = shm_name
         self.sock: Optional[socket.socket] = None
+        self.reader: Optional[PacketReader] = None
+        self.outbox: Optional[PacketQueue] = None
+        self._inbox: "queue.SimpleQueue[Optional[ControlPacket]]" = queue.SimpleQueue()
+        self.pending = PendingJobs()
+        self._executors: Dict[str, Executor] = {}
+        # Packet type -> handler, bound once instead of an if/elif per packet
+        self._handlers = {
+            'JobSubmit': self._execute_job,
+            'JobCancel': self._cancel_job,
+            'Heartbeat': self._heartbeat,
+        }
         self.shm: Optional[SharedMemoryAccess] = None
         self.running = False
         self.worker_id = f"worker_{slot_id}_{os.getpid()}"
@@ -266,6 +628,8 @@ class Worker:
         """Connect to the host supervisor"""
         self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self.sock.connect(self.socket_path)
+        self.reader = PacketReader(self.sock)
+        self.outbox = PacketQueue(self.sock)
         logger.info(f"Connected to {self.socket_path}")
         
         # Send handshake
@@ -276,38 +640,15 @@ class Worker:
                 "type": "Handshake",
                 "protocol_version": PROTOCOL_VERSION,
                 "worker_id": self.worker_id,
-                "capabilities": self._detect_capabilities()
+                "capabilities": detect_capabilities()
             }
         )
         send_packet(self.sock, packet)
         
         # Wait for ack
-        ack = recv_packet(self.sock)
+        ack = self.reader.read_packet()
         logger.info(f"Received handshake ack: {ack.payload}")
     
-    def _detect_capabilities(self) -> List[str]:
-        """Detect available capabilities (CUDA, etc.)"""
-        caps = []
-        
-        try:
-            import torch
-            if torch.cuda.is_available():
-                caps.append("CUDA")
-                caps.append(f"GPU:{torch.cuda.get_device_name(0)}")
-            if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-                caps.append("MPS")
-            caps.append("TORCH")
-        except ImportError:
-            pass
-        
-        try:
-            import numpy
-            caps.append("NUMPY")
-        except ImportError:
-            pass
-        
-        return caps
-    
     def run(self):
         """Main event loop"""
         self.running = True
@@ -318,34 +659,94 @@ class Worker:
         
         logger.info(f"Worker {self.worker_id} starting main loop")
         
+        # Packets are received and decoded on a separate thread, so packet
+        # N+1 is read off the socket while packet N executes
+        receiver = threading.Thread(
+            target=self._recv_loop, name="vortex-recv", daemon=True
+        )
+        receiver.start()
+        
         while self.running:
-            try:
-                packet = recv_packet(self.sock)
-                self._handle_packet(packet)
-            except ConnectionError:
+            # Take every packet already waiting (up to a limit) so their
+            # replies, typically heartbeats, go out in one write
+            batch = [self._inbox.get()]
+            while len(batch) < REPLY_BATCH_SIZE:
+                try:
+                    batch.append(self._inbox.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for packet in batch:
+                if packet is None:
+                    break
+                try:
+                    self._dispatch_packet(packet)
+                except Exception as e:
+                    logger.error(f"Error in main loop: {e}")
+                    traceback.print_exc()
+            self.outbox.flush()
+            
+            # The receive thread's None sentinel is always its last item
+            if batch[-1] is None:
                 logger.warning("Connection lost")
                 break
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                traceback.print_exc()
+    
+    def _recv_loop(self):
+        """Receive thread: decode packets into the inbox, None on disconnect"""
+        try:
+            while self.running:
+                try:
+                    packet = self.reader.read_packet()
+                except (ConnectionError, OSError):
+                    break
+                except Exception as e:
+                    # The bad frame is already consumed; keep reading
+                    logger.error(f"Failed to decode packet: {e}")
+                    continue
+                
+                # Track queued jobs so a cancel can overtake them
+                ptype = packet.payload.get('type')
+                if ptype == 'JobSubmit':
+                    self.pending.add(packet.payload.get('job_id'))
+                elif ptype == 'JobCancel':
+                    self.pending.cancel(packet.payload.get('job_id'))
+                self._inbox.put(packet)
+        finally:
+            self._inbox.put(None)
     
     def _handle_packet(self, packet: ControlPacket):
-        """Handle incoming packets"""
-        payload = packet.payload
-        ptype = payload.get('type')
-        
-        if ptype == 'JobSubmit':
-            self._execute_job(packet)
-        elif ptype == 'JobCancel':
-            logger.info(f"Job cancelled: {payload.get('job_id')}")
-        elif ptype == 'Heartbeat':
-            # Respond to heartbeat
-            response = ControlPacket(
-                request_id=packet.request_id,
-                timestamp=int(time.time() * 1000),
-                payload={"type": "Heartbeat", "worker_id": self.worker_id}
-            )
-            send_packet(self.sock, response)
+        """Handle an incoming packet and flush any replies it produced"""
+        try:
+            self._dispatch_packet(packet)
+        finally:
+            self.outbox.flush()
+    
+    def _dispatch_packet(self, packet: ControlPacket):
+        """Route a packet to its handler; replies are queued on the outbox"""
+        handler = self._handlers.get(packet.payload.get('type'))
+        if handler is not None:
+            handler(packet)
+    
+    def _cancel_job(self, packet: ControlPacket):
+        # Queued jobs are flagged by the receive thread (see PendingJobs)
+        logger.info(f"Job cancelled: {packet.payload.get('job_id')}")
+    
+    def _heartbeat(self, packet: ControlPacket):
+        response = ControlPacket(
+            request_id=packet.request_id,
+            timestamp=int(time.time() * 1000),
+            payload={"type": "Heartbeat", "worker_id": self.worker_id}
+        )
+        self.outbox.push(response)
+    
+    def _get_executor(self, op_type: str) -> Optional[Executor]:
+        """Executor instance for op_type, created on first use and reused"""
+        executor = self._executors.get(op_type)
+        if executor is None:
+            executor = get_executor(op_type)
+            if executor is not None:
+                self._executors[op_type] = executor
+        return executor
     
     def _execute_job(self, packet: ControlPacket):
         """Execute a job"""
@@ -354,20 +755,47 @@ class Worker:
         op_type = payload.get('op_type')
         params = payload.get('params', {})
         
+        entry = self.pending.pop(job_id)
+        if entry is not None and entry[0]:
+            logger.info(f"Skipping cancelled job {job_id}")
+            self.outbox.push(ControlPacket(
+                request_id=packet.request_id,
+                timestamp=int(time.time() * 1000),
+                payload={
+                    "type": "JobResult",
+                    "job_id": job_id,
+                    "success": False,
+                    "error_message": "Job cancelled",
+                    "duration_us": 0,
+                    "peak_vram_mb": 0
+                }
+            ))
+            return
+        
+        # Don't hold earlier replies in the batch back while the job runs
+        self.outbox.flush()
+        
         logger.info(f"Executing job {job_id}: {op_type}")
         start_time = time.perf_counter_ns()
+        if entry is not None:
+            logger.debug(f"Job {job_id} queued for {(start_time - entry[1]) // 1000}us")
         
         try:
             # Get executor
-            executor = get_executor(op_type)
+            executor = self._get_executor(op_type)
             if not executor:
                 raise ValueError(f"Unknown op_type: {op_type}")
             
-            # Execute (TODO: Add proper input handling from SHM)
-            result = executor.execute({}, params)
+            # Inputs are zero-copy views over shared memory
+            inputs = self._map_inputs(payload.get('inputs') or {})
+            result = executor.execute(inputs, params)
             
             duration_us = (time.perf_counter_ns() - start_time) // 1000
             
+            # Results already in SHM are reported by offset; the host reads
+            # them in place, so the payload never travels over the socket
+            output_handle = self.shm.offset_of(result) if self.shm else None
+            
             # Send success result
             response = ControlPacket(
                 request_id=packet.request_id,
@@ -376,12 +804,12 @@ class Worker:
                     "type": "JobResult",
                     "job_id": job_id,
                     "success": True,
-                    "output_handle": None,  # TODO: Write to SHM
+                    "output_handle": output_handle,
                     "duration_us": duration_us,
                     "peak_vram_mb": 0  # TODO: Track VRAM
                 }
             )
-            send_packet(self.sock, response)
+            self.outbox.push(response)
             
         except Exception as e:
             duration_us = (time.perf_counter_ns() - start_time) // 1000
@@ -400,11 +828,25 @@ class Worker:
                     "peak_vram_mb": 0
                 }
             )
-            send_packet(self.sock, response)
+            self.outbox.push(response)
+    
+    def _map_inputs(self, specs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Build executor inputs from {name: {offset, shape, dtype}} SHM refs"""
+        if not specs:
+            return {}
+        if not self.shm or not self.shm.mm:
+            raise RuntimeError("Job has SHM inputs but shared memory is not mapped")
+        return {
+            name: self.shm.tensor(spec['offset'], spec['shape'], spec['dtype'])
+            for name, spec in specs.items()
+        }
     
     def shutdown(self):
         """Clean shutdown"""
         self.running = False
+        for executor in self._executors.values():
+            executor.cleanup()
+        self._executors.clear()
         if self.shm:
             self.shm.close()
         if self.sock:
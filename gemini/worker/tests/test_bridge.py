@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 import torch
 import pyarrow as pa
-from vortex_worker.bridge import arrow_to_tensor, tensor_to_arrow
+from vortex_worker.bridge import TensorPool, arrow_to_tensor, benchmark_transfer, tensor_to_arrow
 
 def test_tensor_to_arrow_conversion():
     """Test converting a PyTorch tensor to Arrow buffer."""
@@ -13,12 +13,23 @@ def test_tensor_to_arrow_conversion():
     
     assert shape == (2, 2)
     assert dtype_str == "float32"
-    assert isinstance(buffer, bytes)
+    # CPU tensors are exported without copying
+    assert isinstance(buffer, memoryview)
     
     # Verify content
     numpy_array = np.frombuffer(buffer, dtype=np.float32).reshape(shape)
     assert np.allclose(numpy_array, tensor.numpy())
     
+def test_tensor_to_arrow_copy():
+    """copy=True returns bytes that do not alias the tensor."""
+    tensor = torch.zeros(4, dtype=torch.float32)
+
+    buffer, _, _ = tensor_to_arrow(tensor, copy=True)
+    tensor += 1
+
+    assert isinstance(buffer, bytes)
+    assert np.all(np.frombuffer(buffer, dtype=np.float32) == 0)
+
 def test_arrow_to_tensor_conversion():
     """Test converting Arrow buffer back to PyTorch tensor."""
     shape = (2, 3)
@@ -56,3 +67,30 @@ def test_zero_copy_check():
     # The key is that successful execution means the API works.
     tensor = arrow_to_tensor(buffer, (3,), "float32", device="cpu")
     assert torch.equal(tensor, torch.tensor([1.0, 2.0, 3.0]))
+
+def test_tensor_pool_reuses_buffers():
+    """Released buffers are handed out again for any shape in the same bucket."""
+    pool = TensorPool()
+    a = pool.acquire((3, 5), torch.float32)
+    assert a.shape == (3, 5)
+    assert a.dtype == torch.float32
+    ptr = a.data_ptr()
+    pool.release(a)
+
+    # 60 bytes and 64 bytes both land in the 64-byte bucket
+    b = pool.acquire((16,), torch.float32)
+    assert b.data_ptr() == ptr
+
+def test_tensor_pool_ignores_foreign_tensors():
+    """Tensors the pool did not allocate are never recycled."""
+    pool = TensorPool()
+    foreign = torch.zeros(64, dtype=torch.uint8)
+    pool.release(foreign[:8])
+    assert pool.acquire((64,), torch.uint8).data_ptr() != foreign.data_ptr()
+
+@pytest.mark.parametrize("dtype", ["bfloat16", "int8"])
+def test_benchmark_transfer_narrow_dtypes(dtype):
+    """Narrow dtypes survive the benchmark roundtrip."""
+    results = benchmark_transfer(size_mb=1, dtype=dtype)
+    assert results["dtype"] == dtype
+    assert results["verified"]
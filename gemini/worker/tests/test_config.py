@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from vortex_worker.config import parse_slot_id
+
+
+def test_parse_slot_id_numeric():
+    """Plain integers and numeric pod-name suffixes map directly."""
+    assert parse_slot_id("") == 0
+    assert parse_slot_id("7") == 7
+    assert parse_slot_id("worker-abc-300") == 300 % 256
+
+
+def test_parse_slot_id_stable_across_interpreters():
+    """Non-numeric names hash to the same slot in every process."""
+    slot = parse_slot_id("worker-abc")
+    assert 0 <= slot < 256
+
+    code = "from vortex_worker.config import parse_slot_id; print(parse_slot_id('worker-abc'))"
+    for seed in ("1", "2"):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+            env={"PYTHONHASHSEED": seed},
+        )
+        assert int(out.stdout) == slot
@@ -0,0 +1,161 @@
+"""Tests for executor tensor handoff through the SHM arena."""
+
+import ctypes
+import os
+
+import pytest
+
+torch = pytest.importorskip("torch")
+posix_ipc = pytest.importorskip("posix_ipc")
+
+from vortex_worker import _dlpack  # noqa: E402
+from vortex_worker.executor import ExecutorRegistry, TensorHandle  # noqa: E402
+from vortex_worker.nodes import CLIPTextEncode, KSamplerExecutor  # noqa: E402
+from vortex_worker.shm import ShmArena  # noqa: E402
+
+
+@pytest.fixture
+def arena():
+    name = f"/vortex-test-{os.getpid()}"
+    shm = ShmArena(name, size=1 << 20)
+    yield shm
+    ExecutorRegistry.clear_instances(shm)
+    posix_ipc.unlink_shared_memory(name)
+
+
+def test_get_tensor_aliases_shm(arena):
+    executor = CLIPTextEncode(arena)
+    offset = arena.get_tensor_offset()
+
+    tensor = executor.get_tensor(TensorHandle(offset, (2, 3), "float32", "cpu"))
+    tensor.fill_(1.5)
+
+    # A second view over the same bytes sees the write: no copy was made
+    flat = executor.get_tensor(TensorHandle(offset, (6,), "float32", "cpu"))
+    assert torch.equal(flat, torch.full((6,), 1.5))
+
+
+def test_put_tensor_resolves_arena_offset(arena):
+    executor = CLIPTextEncode(arena)
+    offset = arena.get_tensor_offset()
+    tensor = executor.get_tensor(TensorHandle(offset, (4, 4), "float16", "cpu"))
+
+    handle = executor.put_tensor(tensor[2:], device="cpu")
+
+    assert handle.offset == offset + 2 * 4 * 2
+    assert handle.shape == (2, 4)
+    assert handle.dtype == "float16"
+
+
+def test_get_tensor_rejects_out_of_bounds(arena):
+    executor = CLIPTextEncode(arena)
+    with pytest.raises(ValueError):
+        executor.get_tensor(TensorHandle(arena.size - 4, (2,), "float32", "cpu"))
+
+
+def test_get_tensor_ignores_non_tensor_handles(arena):
+    executor = CLIPTextEncode(arena)
+    assert executor.get_tensor(TensorHandle(0, (), "model")) is None
+
+
+def test_close_refuses_while_tensor_alive(arena):
+    executor = CLIPTextEncode(arena)
+    tensor = executor.get_tensor(TensorHandle(arena.get_tensor_offset(), (4,), "float32", "cpu"))
+
+    with pytest.raises(BufferError):
+        arena.close()
+
+    del tensor
+    arena.close()
+    assert arena.mm.closed
+
+
+def test_unconsumed_capsule_is_released():
+    buf = (ctypes.c_float * 4)()
+    before = len(_dlpack._live)
+
+    capsule = _dlpack.to_capsule(ctypes.addressof(buf), (4,), "float32", owner=buf)
+    assert len(_dlpack._live) == before + 1
+
+    del capsule
+    assert len(_dlpack._live) == before
+
+
+def test_registry_ids_index_executors():
+    op_id = ExecutorRegistry.op_id("Sampler::KSampler")
+    assert op_id == KSamplerExecutor.OP_ID
+    assert ExecutorRegistry.get_by_id(op_id) is KSamplerExecutor
+    assert ExecutorRegistry.op_id("Unknown::Op") == -1
+    assert ExecutorRegistry.get_by_id(-1) is None
+
+
+def test_execute_node_by_id(arena):
+    op_id = ExecutorRegistry.op_id("Encoder::CLIP")
+    result = ExecutorRegistry.execute_node(op_id, {}, {"text": "a cat"}, arena)
+    assert result.success
+
+    result = ExecutorRegistry.execute_node(-1, {}, {}, arena)
+    assert not result.success
+
+
+def test_executor_instances_are_reused(arena):
+    op_id = ExecutorRegistry.op_id("Loader::Checkpoint")
+    first = ExecutorRegistry.get_instance(op_id, arena)
+    assert ExecutorRegistry.get_instance(op_id, arena) is first
+
+    ExecutorRegistry.clear_instances(arena)
+    assert ExecutorRegistry.get_instance(op_id, arena) is not first
+
+
+def test_now_us_is_monotonic_microseconds():
+    import time
+
+    from vortex_worker.executor import _now_us
+
+    start = _now_us()
+    time.sleep(0.01)
+    elapsed = _now_us() - start
+    assert 10_000 <= elapsed < 1_000_000
+
+
+def test_load_profile_ranks_hot_op_types():
+    try:
+        ranked = ExecutorRegistry.load_profile(
+            '{"Decoder::VAE": 10, "Sampler::KSampler": 80, "Unknown::Op": 99}'
+        )
+        assert ranked == ["Sampler::KSampler", "Decoder::VAE"]
+        # Fast path and dict lookup agree, on equal but distinct strings
+        op_type = "".join(["Sampler::", "KSampler"])
+        assert ExecutorRegistry.op_id(op_type) == KSamplerExecutor.OP_ID
+        assert ExecutorRegistry.op_id("Encoder::CLIP") == CLIPTextEncode.OP_ID
+    finally:
+        ExecutorRegistry._hot = ()
+
+
+@pytest.mark.parametrize("profile", ["[]", '"x"', "1", '{"Decoder::VAE": "x"}'])
+def test_load_profile_rejects_malformed_profiles(profile):
+    with pytest.raises(ValueError):
+        ExecutorRegistry.load_profile(profile)
+    assert ExecutorRegistry._hot == ()
+
+
+def test_executors_load_on_first_use():
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys\n"
+        "from vortex_worker.executor import ExecutorRegistry\n"
+        "assert 'vortex_worker.nodes' not in sys.modules\n"
+        "assert 'torch' not in sys.modules\n"
+        "assert 'Sampler::KSampler' in ExecutorRegistry.list()\n"
+        "assert 'vortex_worker.nodes' not in sys.modules\n"
+        "assert ExecutorRegistry.op_id('Sampler::KSampler') >= 0\n"
+        "assert 'vortex_worker.nodes' in sys.modules\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=Path(__file__).parent.parent,
+    )
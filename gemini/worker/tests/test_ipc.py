@@ -0,0 +1,134 @@
+"""Tests for the IPC socket and the worker's epoll loop."""
+
+import os
+import select
+import socket
+import struct
+import time
+from array import array
+
+import pytest
+
+ipc = pytest.importorskip("vortex_worker.ipc")
+posix_ipc = pytest.importorskip("posix_ipc")
+
+from vortex_worker import main  # noqa: E402
+from vortex_worker.config import WorkerConfig  # noqa: E402
+from vortex_worker.generated import control  # noqa: E402
+from vortex_worker.shm import ShmArena  # noqa: E402
+
+
+@pytest.fixture
+def link(tmp_path):
+    """A connected (worker IPCSocket, host socket) pair."""
+    path = str(tmp_path / "ipc.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    worker = ipc.IPCSocket(path)
+    worker.connect()
+    host, _ = server.accept()
+    yield worker, host
+    worker.close()
+    host.close()
+    server.close()
+
+
+def send_job(host, job_id, params=b"{}"):
+    request = control.JobRequest(job_id=job_id, node_type="Sampler::KSampler", params_json=params)
+    tensor_input = request.inputs.add(name="latent")
+    tensor_input.tensor.offset = 16384
+    tensor_input.tensor.size_bytes = 64
+    tensor_input.tensor.dtype = 1
+    tensor_input.tensor.shape.extend([1, 4, 2, 2])
+    request.outputs.add(name="samples", dtype=1).expected_shape.extend([1, 4])
+    data = request.SerializeToString()
+    host.sendall(struct.pack(">I", len(data)) + data)
+
+
+def read_result(host):
+    (length,) = struct.unpack(">I", host.recv(4, socket.MSG_WAITALL))
+    result = control.JobResult()
+    result.ParseFromString(host.recv(length, socket.MSG_WAITALL))
+    return result
+
+
+def test_receive_into_pooled_cjob(link):
+    worker, host = link
+    pool = ipc.CJobPool(size=1)
+    send_job(host, "j1", b'{"steps": 3}')
+
+    cjob = worker.receive_ready_cjob(pool)
+
+    assert isinstance(cjob, ipc.CJob)
+    assert (cjob.job_id, cjob.node_type) == ("j1", "Sampler::KSampler")
+    assert cjob.params() == b'{"steps": 3}'
+    assert cjob.num_inputs == cjob.num_outputs == 1
+    latent = cjob.inputs[0]
+    assert (latent.offset, latent.size_bytes, latent.ndim) == (16384, 64, 4)
+    assert list(latent.shape[: latent.ndim]) == [1, 4, 2, 2]
+
+    # Released structs are handed out again
+    pool.release(cjob)
+    send_job(host, "j2")
+    assert worker.receive_ready_cjob(pool) is cjob
+    assert cjob.job_id == "j2"
+
+
+def test_oversized_job_falls_back_to_dataclass(link):
+    worker, host = link
+    send_job(host, "big", b"x" * (ipc.CJOB_PARAMS_SIZE + 1))
+
+    job = worker.receive_ready_cjob(ipc.CJobPool())
+
+    assert isinstance(job, ipc.Job)
+    assert job.job_id == "big"
+    assert len(job.params_json) == ipc.CJOB_PARAMS_SIZE + 1
+
+
+def test_epoll_loop_answers_cjob_jobs(link):
+    worker, host = link
+    name = f"/vortex-ipc-test-{os.getpid()}"
+    shm = ShmArena(name, size=1 << 20)
+    timer = main.HeartbeatTimer.create(main.HEARTBEAT_INTERVAL_MS)
+    if timer is None:
+        pytest.skip("timerfd unavailable")
+    heartbeat = memoryview(array("Q", [0]))
+    config = WorkerConfig(slot_id=0, shm_name=name, ipc_path="")
+    try:
+        send_job(host, "j1")
+        send_job(host, "big", b"x" * (ipc.CJOB_PARAMS_SIZE + 1))
+        host.shutdown(socket.SHUT_WR)
+
+        main.run_epoll_loop(worker, timer, heartbeat, shm, config, lambda: False)
+
+        assert [read_result(host).job_id for _ in range(2)] == ["j1", "big"]
+    finally:
+        timer.close()
+        shm.close()
+        posix_ipc.unlink_shared_memory(name)
+
+
+def test_idle_loop_acks_timer_ticks():
+    timer = main.HeartbeatTimer.create(10)
+    if timer is None:
+        pytest.skip("timerfd unavailable")
+    ep = select.epoll()
+    ep.register(timer.fileno(), select.EPOLLIN)
+    heartbeat = memoryview(array("Q", [0]))
+    checks = 0
+
+    def should_stop():
+        nonlocal checks
+        checks += 1
+        return checks > 3
+
+    try:
+        start = time.monotonic()
+        assert main.idle_until_readable(ep, timer, heartbeat, lambda: 7, should_stop) == 0
+        # Each wakeup waited for a tick instead of spinning on an unread fd
+        assert time.monotonic() - start >= 0.02
+        assert heartbeat[0] == 7
+    finally:
+        ep.close()
+        timer.close()
@@ -0,0 +1,255 @@
+"""Tests for ModelLoader.
+
+Covers safetensors checkpoint loading without the safetensors package,
+unload cache trimming, background prefetch, device placement checks and
+the shared catalog.
+"""
+
+import json
+import struct
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from vortex_worker import model_loader  # noqa: E402
+from vortex_worker.model_loader import ModelLoader, safetensors_index  # noqa: E402
+
+
+def write_safetensors(path, tensors):
+    """Write {key: (dtype, ndarray)} in the safetensors layout."""
+    header, blobs, offset = {}, [], 0
+    for key, (dtype, array) in tensors.items():
+        blob = array.tobytes()
+        header[key] = {
+            "dtype": dtype,
+            "shape": list(array.shape),
+            "data_offsets": [offset, offset + len(blob)],
+        }
+        offset += len(blob)
+        blobs.append(blob)
+    header["__metadata__"] = {"format": "pt"}
+    raw = json.dumps(header).encode()
+    raw += b" " * (-len(raw) % 8)
+    path.write_bytes(struct.pack("<Q", len(raw)) + raw + b"".join(blobs))
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    path = tmp_path / "model.safetensors"
+    bf16 = torch.tensor([1.5, -2.0], dtype=torch.bfloat16).view(torch.int16).numpy()
+    write_safetensors(
+        path,
+        {
+            "weight": ("F32", np.arange(6, dtype=np.float32).reshape(2, 3)),
+            "scale": ("BF16", bf16.view(np.uint16)),
+            "ids": ("I8", np.array([-1, 2], dtype=np.int8)),
+        },
+    )
+    return str(path)
+
+
+def test_index_is_parsed_once(checkpoint):
+    model_loader._read_index.cache_clear()
+    base, index = safetensors_index(checkpoint)
+    safetensors_index(checkpoint)
+
+    assert model_loader._read_index.cache_info().hits == 1
+    assert base % 8 == 0
+    assert set(index) == {"weight", "scale", "ids"}
+    assert index["weight"]["shape"] == [2, 3]
+
+
+def test_map_selected_tensors(checkpoint):
+    tensors = ModelLoader._map_tensors(checkpoint, ["weight", "scale"])
+
+    assert set(tensors) == {"weight", "scale"}
+    assert torch.equal(tensors["weight"], torch.arange(6, dtype=torch.float32).reshape(2, 3))
+    assert tensors["scale"].dtype == torch.bfloat16
+    assert tensors["scale"].tolist() == [1.5, -2.0]
+
+
+def test_dtype_table_tolerates_missing_torch_dtypes():
+    dtypes = model_loader._TorchDtypes()
+
+    assert dtypes["F8_E4M3"] is getattr(torch, "float8_e4m3fn", None)
+    assert dtypes["U32"] is getattr(torch, "uint32", None)
+    assert dtypes["F4"] is None
+
+
+def test_unmappable_dtype_falls_back_to_safetensors(checkpoint, monkeypatch):
+    pytest.importorskip("safetensors")
+    monkeypatch.setitem(model_loader._ST_TORCH_DTYPES, "I8", None)
+
+    tensors = ModelLoader._map_tensors(checkpoint, ["weight", "ids"])
+
+    assert set(tensors) == {"weight", "ids"}
+    assert tensors["ids"].tolist() == [-1, 2]
+
+
+def test_load_checkpoint_cpu_maps_whole_file(checkpoint, tmp_path):
+    loader = ModelLoader(cache_dir=str(tmp_path / "cache"))
+    tensors = loader.load_checkpoint(checkpoint, device="cpu")
+
+    assert set(tensors) == {"weight", "scale", "ids"}
+    assert tensors["ids"].tolist() == [-1, 2]
+    # Views into the mapping, not copies
+    tensors["weight"][0, 0] = 42.0
+    again = ModelLoader._map_tensors(checkpoint, ["weight"])
+    assert again["weight"][0, 0] == 0.0
+
+
+def test_load_checkpoint_keys_select_prefetch_keys_do_not(checkpoint, tmp_path):
+    loader = ModelLoader(cache_dir=str(tmp_path / "cache"))
+
+    subset = loader.load_checkpoint(checkpoint, device="cpu", keys=["ids"])
+    assert set(subset) == {"ids"}
+
+    full = loader.load_checkpoint(checkpoint, device="cpu", prefetch_keys=["ids"])
+    assert set(full) == {"weight", "scale", "ids"}
+
+    with pytest.raises(ValueError):
+        loader.load_checkpoint(checkpoint, lazy=True, keys=["ids"])
+
+
+def test_unload_defers_cache_trim(tmp_path):
+    class Pipe:
+        components = {"unet": torch.nn.Linear(1024, 512)}  # 2 MB of weights
+
+    loader = ModelLoader(cache_dir=str(tmp_path))
+    loader.loaded_models = {"a": Pipe(), "b": Pipe()}
+
+    assert loader.unload("a")
+    assert loader._unload_pressure_mb == 2
+    loader.unload_all()
+    assert loader._unload_pressure_mb == 0
+    assert not loader.loaded_models
+
+
+def test_prefetch_of_loaded_model_resolves_immediately(tmp_path):
+    loader = ModelLoader(cache_dir=str(tmp_path))
+    pipe = object()
+    loader.loaded_models["sd15"] = pipe
+
+    future = loader.prefetch("sd15")
+    assert future.done() and future.result() is pipe
+    assert not loader._pending
+
+
+@pytest.fixture
+def slow_diffusers(monkeypatch):
+    """A diffusers stand-in whose from_pretrained blocks until released."""
+
+    class Pipe:
+        components: dict = {}
+
+    class AutoPipelineForText2Image:
+        calls: list = []
+        release = threading.Event()
+
+        @classmethod
+        def from_pretrained(cls, repo_id, **kwargs):
+            cls.calls.append(repo_id)
+            assert cls.release.wait(10)
+            return Pipe()
+
+    module = types.ModuleType("diffusers")
+    module.AutoPipelineForText2Image = AutoPipelineForText2Image
+    monkeypatch.setitem(sys.modules, "diffusers", module)
+    return AutoPipelineForText2Image
+
+
+def test_load_waits_for_in_flight_prefetch(tmp_path, slow_diffusers):
+    loader = ModelLoader(cache_dir=str(tmp_path))
+    prefetched = loader.prefetch("sd15", device="cpu")
+
+    result = {}
+    foreground = threading.Thread(
+        target=lambda: result.update(pipe=loader.load_pipeline("sd15", device="cpu"))
+    )
+    foreground.start()
+    slow_diffusers.release.set()
+    foreground.join(10)
+
+    assert result["pipe"] is prefetched.result()
+    assert len(slow_diffusers.calls) == 1
+
+
+def test_prefetch_joins_in_flight_foreground_load(tmp_path, slow_diffusers):
+    loader = ModelLoader(cache_dir=str(tmp_path))
+    foreground = threading.Thread(
+        target=loader.load_pipeline, args=("sd15",), kwargs={"device": "cpu"}
+    )
+    foreground.start()
+    while not slow_diffusers.calls:
+        threading.Event().wait(0.01)
+
+    future = loader.prefetch("sd15", device="cpu")
+    slow_diffusers.release.set()
+    foreground.join(10)
+
+    assert future.result() is loader.loaded_models["sd15"]
+    assert len(slow_diffusers.calls) == 1
+    assert not loader._pending
+
+
+def test_close_cancels_queued_prefetches(tmp_path, slow_diffusers):
+    loader = ModelLoader(cache_dir=str(tmp_path))
+    running = loader.prefetch("sd15", device="cpu")
+    while not slow_diffusers.calls:
+        threading.Event().wait(0.01)
+    queued = loader.prefetch("sdxl", device="cpu")
+
+    loader.close()
+    slow_diffusers.release.set()
+
+    assert queued.cancelled()
+    assert running.result(10) is not None
+    assert not loader._pending
+    with pytest.raises(RuntimeError):
+        loader.prefetch("sd15-inpaint", device="cpu")
+
+
+def test_on_device_requires_every_component():
+    class Pipe:
+        def __init__(self, **components):
+            self.components = components
+
+    # Denoiser placed at load time (as bitsandbytes does), text encoder not
+    partial = Pipe(unet=torch.nn.Linear(2, 2, device="meta"), text_encoder=torch.nn.Linear(2, 2))
+    assert not ModelLoader._on_device(partial, "meta")
+
+    placed = Pipe(unet=torch.nn.Linear(2, 2, device="meta"), scheduler=object())
+    assert ModelLoader._on_device(placed, "meta")
+
+
+def test_catalog_overrides_stay_per_loader(tmp_path):
+    first = ModelLoader(cache_dir=str(tmp_path))
+    second = ModelLoader(cache_dir=str(tmp_path))
+    custom = model_loader.ModelInfo(id="me/custom", name="Custom", type="diffusers")
+
+    first.catalog["custom"] = custom
+
+    assert first.get_model_info("custom") is custom
+    assert second.get_model_info("custom") is None
+    assert "custom" not in model_loader.MODEL_CATALOG
+    assert first.get_model_info("sd15") is model_loader.MODEL_CATALOG["sd15"]
+    assert len(first.list_models()) == len(model_loader.MODEL_CATALOG) + 1
+
+
+def test_compile_denoiser(monkeypatch):
+    class Pipe:
+        unet = torch.nn.Linear(2, 2)
+
+    pipe = Pipe()
+    monkeypatch.delattr(torch, "compile")
+    ModelLoader._compile_denoiser(pipe)
+    assert isinstance(pipe.unet, torch.nn.Linear)
+
+    monkeypatch.undo()
+    ModelLoader._compile_denoiser(pipe)
+    assert type(pipe.unet).__name__ == "OptimizedModule"
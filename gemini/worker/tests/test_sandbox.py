@@ -0,0 +1,46 @@
+"""Tests for the static code safety check."""
+
+import pytest
+
+from vortex_worker.sandbox import check_code_safety
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import math\nx = math.sqrt(2)",
+        'def f():\n    """Never calls open(path) or os.system."""\n    return 1',
+        "class Node(Base):\n    def __init__(self):\n        super().__init__()",
+        "from .helpers import blend",
+        "scale = getattr(config, 'scale', 1.0)",
+    ],
+)
+def test_safe_code_passes(code):
+    assert check_code_safety(code)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import os.path",
+        "from subprocess import run",
+        "f = eval",
+        "open('/etc/passwd')",
+        'getattr(__builtins__, "ope" + "n")("x")',
+        "().__class__.__base__.__subclasses__()",
+        "shutil.rmtree(path)",
+        "def broken(:",
+        "import builtins; getattr(builtins,'ev'+'al')('1')",
+        "getattr(getattr(0,'__cla'+'ss__'),'__subcla'+'sses__')()",
+        "import importlib; importlib.import_module('o'+'s').system('id')",
+        "import sys; sys.modules['o'+'s'].system('id')",
+        "breakpoint()",
+        "getattr(obj, '__class__')",
+        "g = getattr",
+        "import pathlib; pathlib.os.system('id')",
+        "import io; io.open('/etc/passwd','w')",
+        "getattr(pathlib, 'os')",
+    ],
+)
+def test_dangerous_code_fails(code):
+    assert not check_code_safety(code)
@@ -0,0 +1,80 @@
+"""Tests for the shared memory arena bindings."""
+
+import os
+
+import pytest
+
+posix_ipc = pytest.importorskip("posix_ipc")
+
+from vortex_worker.shm import ShmArena  # noqa: E402
+
+
+@pytest.fixture
+def arena():
+    name = f"/vortex-shm-test-{os.getpid()}"
+    shm = ShmArena(name, size=1 << 20)
+    yield shm
+    posix_ipc.unlink_shared_memory(name)
+
+
+def test_heartbeat_view_writes_slot(arena):
+    heartbeat = arena.register_worker(3)
+    heartbeat[0] = 1_700_000_000_123
+
+    assert arena.header.slots[3].last_heartbeat == 1_700_000_000_123
+    assert arena.header.slots[2].last_heartbeat == 0
+    assert arena.header.slots[3].pid == os.getpid()
+
+
+def test_slot_stores_match_ctypes_layout(arena):
+    arena.register_worker(5)
+    arena.set_status(5, 3)
+    arena.set_progress(5, 1.5)
+    arena.update_heartbeat(5)
+
+    slot = arena.header.slots[5]
+    assert slot.status == 3
+    assert slot.progress == 1.0
+    assert slot.last_heartbeat > 0
+    assert arena.header.slots[4].status == 0
+
+    arena.set_progress(5, -0.5)
+    assert slot.progress == 0.0
+    arena.set_progress(5, float("nan"))
+    assert slot.progress == 0.0
+    arena.set_progress(5, 0.25)
+    assert slot.progress == 0.25
+
+
+def test_tensor_offset_follows_slot_table(arena):
+    assert arena.get_tensor_offset() == 64 + 256 * 64
+
+
+def test_header_lock_and_worker_count(arena):
+    assert arena.try_lock()
+    assert not arena.try_lock()
+    arena.unlock()
+    assert arena.header.lock == 0
+
+    arena.register_worker(0)
+    arena.register_worker(1)
+    arena.register_worker(1)  # re-registering a live slot is not counted
+    assert arena.num_workers == arena.header.num_workers == 2
+
+
+def test_heartbeat_clock_tracks_wall_time(arena):
+    import time
+
+    first = arena.now_ms()
+    assert abs(first - time.time_ns() // 1_000_000) < 1000
+    assert arena.now_ms() >= first
+
+
+def test_close_releases_heartbeat_view(arena):
+    heartbeat = arena.register_worker(0)
+
+    arena.close()
+    arena.close()
+
+    with pytest.raises(ValueError):
+        heartbeat[0] = 1
@@ -1,4 +1,11 @@
 """VORTEX Compute Worker Package."""
 
+import os
+
+# Select the C (upb) protobuf runtime before any generated module imports
+# google.protobuf; the pure-Python runtime decodes messages far slower.
+# An explicit setting in the environment still wins.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 __version__ = "0.1.0"
 __author__ = "SOMATECH"
@@ -0,0 +1,99 @@
+"""Atomic operations on shared-memory words.
+
+Binds the GCC runtime's ``libatomic`` entry points with ctypes, so header
+fields the Rust host treats as ``AtomicU32`` are read and written with the
+same lock-free instructions on this side. No extension module has to be
+built. Where libatomic is missing, plain stores and loads are used instead
+(still single aligned accesses) and read-modify-write operations are not
+atomic across processes.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+
+logger = logging.getLogger(__name__)
+
+# __ATOMIC_* memory orders
+RELAXED = 0
+ACQUIRE = 2
+RELEASE = 3
+ACQ_REL = 4
+SEQ_CST = 5
+
+try:
+    _lib = ctypes.CDLL(ctypes.util.find_library("atomic") or "libatomic.so.1")
+
+    _load_4 = _lib.__atomic_load_4
+    _load_4.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _load_4.restype = ctypes.c_uint32
+
+    _store_4 = _lib.__atomic_store_4
+    _store_4.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_int]
+    _store_4.restype = None
+
+    _fetch_add_4 = _lib.__atomic_fetch_add_4
+    _fetch_add_4.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_int]
+    _fetch_add_4.restype = ctypes.c_uint32
+
+    _cas_4 = _lib.__atomic_compare_exchange_4
+    _cas_4.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_uint32),
+        ctypes.c_uint32,
+        ctypes.c_int,
+        ctypes.c_int,
+    ]
+    _cas_4.restype = ctypes.c_bool
+
+    ATOMICS_AVAILABLE = True
+except (OSError, AttributeError):
+    ATOMICS_AVAILABLE = False
+    logger.warning("libatomic unavailable - SHM counters are not updated atomically")
+
+
+def _word(addr: int) -> ctypes.c_uint32:
+    return ctypes.c_uint32.from_address(addr)
+
+
+def load_u32_acq(addr: int) -> int:
+    """Load the uint32 at ``addr`` with acquire ordering."""
+    if ATOMICS_AVAILABLE:
+        return _load_4(addr, ACQUIRE)
+    return _word(addr).value
+
+
+def store_u32_rel(addr: int, value: int) -> None:
+    """Store ``value`` to the uint32 at ``addr`` with release ordering."""
+    if ATOMICS_AVAILABLE:
+        _store_4(addr, value, RELEASE)
+    else:
+        _word(addr).value = value
+
+
+def fetch_add_u32(addr: int, delta: int) -> int:
+    """Add ``delta`` to the uint32 at ``addr``; returns the previous value."""
+    if ATOMICS_AVAILABLE:
+        return _fetch_add_4(addr, delta, ACQ_REL)
+    word = _word(addr)
+    previous = word.value
+    word.value = (previous + delta) & 0xFFFF_FFFF
+    return previous
+
+
+def cas_u32(addr: int, expected: int, new: int) -> int:
+    """Compare-and-swap the uint32 at ``addr``.
+
+    Returns:
+        The value observed before the operation; the swap happened iff
+        it equals ``expected``
+    """
+    if ATOMICS_AVAILABLE:
+        observed = ctypes.c_uint32(expected)
+        _cas_4(addr, ctypes.byref(observed), new, ACQ_REL, ACQUIRE)
+        return observed.value
+    word = _word(addr)
+    previous = word.value
+    if previous == expected:
+        word.value = new
+    return previous
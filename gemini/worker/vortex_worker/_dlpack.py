@@ -0,0 +1,157 @@
+"""Producer-side DLPack capsules over shared memory.
+
+Builds ``DLManagedTensor`` structs with ctypes that point straight into
+the mapped SHM arena, so any DLPack consumer (``torch.from_dlpack``,
+CuPy, NumPy) can wrap arena memory without copying it.
+"""
+
+import ctypes
+from typing import Any
+
+# ═══════════════════════════════════════════════════════════════
+#                    DLPACK STRUCTURES
+# Must match dlpack.h (unversioned "dltensor" ABI)
+# ═══════════════════════════════════════════════════════════════
+
+KDL_CPU = 1
+
+KDL_INT = 0
+KDL_UINT = 1
+KDL_FLOAT = 2
+KDL_BFLOAT = 4
+KDL_BOOL = 6
+
+
+class DLDevice(ctypes.Structure):
+    _fields_ = [
+        ("device_type", ctypes.c_int32),
+        ("device_id", ctypes.c_int32),
+    ]
+
+
+class DLDataType(ctypes.Structure):
+    _fields_ = [
+        ("code", ctypes.c_uint8),
+        ("bits", ctypes.c_uint8),
+        ("lanes", ctypes.c_uint16),
+    ]
+
+
+class DLTensor(ctypes.Structure):
+    _fields_ = [
+        ("data", ctypes.c_void_p),
+        ("device", DLDevice),
+        ("ndim", ctypes.c_int32),
+        ("dtype", DLDataType),
+        ("shape", ctypes.POINTER(ctypes.c_int64)),
+        ("strides", ctypes.POINTER(ctypes.c_int64)),
+        ("byte_offset", ctypes.c_uint64),
+    ]
+
+
+class DLManagedTensor(ctypes.Structure):
+    pass
+
+
+_Deleter = ctypes.CFUNCTYPE(None, ctypes.POINTER(DLManagedTensor))
+
+DLManagedTensor._fields_ = [
+    ("dl_tensor", DLTensor),
+    ("manager_ctx", ctypes.c_void_p),
+    ("deleter", _Deleter),
+]
+
+
+# dtype name -> (type code, bits)
+DTYPE_CODES: dict[str, tuple[int, int]] = {
+    "float32": (KDL_FLOAT, 32),
+    "float16": (KDL_FLOAT, 16),
+    "bfloat16": (KDL_BFLOAT, 16),
+    "float64": (KDL_FLOAT, 64),
+    "int64": (KDL_INT, 64),
+    "int32": (KDL_INT, 32),
+    "int8": (KDL_INT, 8),
+    "uint8": (KDL_UINT, 8),
+    "bool": (KDL_BOOL, 8),
+}
+
+# Managed tensors alive on the consumer side, keyed by struct address.
+# Each entry keeps the struct, its shape/stride arrays and the memory
+# owner referenced until the consumer calls the deleter.
+_live: dict[int, tuple[Any, ...]] = {}
+
+
+@_Deleter
+def _release(managed):
+    _live.pop(ctypes.addressof(managed.contents), None)
+
+
+_CAPSULE_NAME = b"dltensor"
+
+_PyCapsule_New = ctypes.pythonapi.PyCapsule_New
+_PyCapsule_New.restype = ctypes.py_object
+_PyCapsule_New.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+
+_PyCapsule_IsValid = ctypes.pythonapi.PyCapsule_IsValid
+_PyCapsule_IsValid.restype = ctypes.c_int
+_PyCapsule_IsValid.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+
+_PyCapsule_GetPointer = ctypes.pythonapi.PyCapsule_GetPointer
+_PyCapsule_GetPointer.restype = ctypes.c_void_p
+_PyCapsule_GetPointer.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+
+
+@ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+def _capsule_destructor(capsule):
+    # Consumers rename the capsule to "used_dltensor" and take over the
+    # deleter; a capsule still named "dltensor" was never consumed
+    if _PyCapsule_IsValid(capsule, _CAPSULE_NAME):
+        _release(
+            ctypes.cast(
+                _PyCapsule_GetPointer(capsule, _CAPSULE_NAME), ctypes.POINTER(DLManagedTensor)
+            )
+        )
+
+
+def _contiguous_strides(shape: tuple[int, ...]) -> list[int]:
+    strides = [1] * len(shape)
+    for i in range(len(shape) - 2, -1, -1):
+        strides[i] = strides[i + 1] * shape[i + 1]
+    return strides
+
+
+def to_capsule(address: int, shape: tuple[int, ...], dtype: str, owner: Any = None):
+    """Wrap contiguous host memory at ``address`` in a DLPack capsule.
+
+    Args:
+        address: Absolute address of the first element
+        shape: Tensor shape (C-contiguous layout)
+        dtype: dtype name (see DTYPE_CODES)
+        owner: Object kept alive until the consumer releases the tensor.
+            Pass an exported buffer view (e.g. a ``memoryview`` slice of an
+            mmap) so the mapping cannot be closed under a live tensor.
+
+    Returns:
+        A "dltensor" PyCapsule, to be consumed at most once; an unconsumed
+        capsule releases the tensor when it is garbage collected
+    """
+    code, bits = DTYPE_CODES[dtype]
+    ndim = len(shape)
+
+    shape_arr = (ctypes.c_int64 * ndim)(*shape)
+    strides_arr = (ctypes.c_int64 * ndim)(*_contiguous_strides(shape))
+
+    managed = DLManagedTensor()
+    tensor = managed.dl_tensor
+    tensor.data = address
+    tensor.device = DLDevice(KDL_CPU, 0)
+    tensor.ndim = ndim
+    tensor.dtype = DLDataType(code, bits, 1)
+    tensor.shape = shape_arr
+    tensor.strides = strides_arr
+    tensor.byte_offset = 0
+    managed.deleter = _release
+
+    ptr = ctypes.addressof(managed)
+    _live[ptr] = (managed, shape_arr, strides_arr, owner)
+    return _PyCapsule_New(ptr, _CAPSULE_NAME, ctypes.cast(_capsule_destructor, ctypes.c_void_p))
@@ -5,8 +5,11 @@ using DLPack to enable zero-copy data transfer through shared memory.
 """
 
 import logging
+from collections import defaultdict, deque
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Type stubs for optional imports
@@ -27,6 +30,125 @@ except ImportError:
     pa = None  # type: ignore
 
 
+# dtype name -> (torch dtype, NumPy dtype, itemsize), built once at import.
+# NumPy has no bfloat16, so that entry has no NumPy dtype. These names are
+# the wire dtypes; narrower ones (bfloat16, int8) move 2-4x fewer bytes for
+# data that tolerates the reduced precision.
+_DTYPE_TABLE: dict[str, tuple[Any, Any, int]] = {}
+# torch dtype -> dtype name, for the reverse direction
+_DTYPE_NAMES: dict[Any, str] = {}
+
+if TORCH_AVAILABLE:
+    _DTYPE_TABLE = {
+        "float32": (torch.float32, np.dtype(np.float32), 4),
+        "float16": (torch.float16, np.dtype(np.float16), 2),
+        "bfloat16": (torch.bfloat16, None, 2),
+        "int64": (torch.int64, np.dtype(np.int64), 8),
+        "int32": (torch.int32, np.dtype(np.int32), 4),
+        "int8": (torch.int8, np.dtype(np.int8), 1),
+        "uint8": (torch.uint8, np.dtype(np.uint8), 1),
+        "bool": (torch.bool, np.dtype(np.bool_), 1),
+    }
+    _DTYPE_NAMES = {entry[0]: name for name, entry in _DTYPE_TABLE.items()}
+    _FLOAT32 = _DTYPE_TABLE["float32"]
+
+
+class TensorPool:
+    """Pool of reusable tensor buffers for recurring transfer shapes.
+
+    Buffers are flat uint8 tensors bucketed by the next power of two of
+    their size, so one buffer serves every tensor that fits its bucket.
+    Tensors handed out by ``acquire`` are views into a pooled buffer and
+    go back to the pool via ``release``; tensors the pool did not hand out
+    are ignored.
+    """
+
+    def __init__(self, max_per_bucket: int = 4):
+        self.max_per_bucket = max_per_bucket
+        self._free: dict[tuple[int, str, bool], deque] = defaultdict(deque)
+        # (event, key, buffer) for buffers still read by an async copy
+        self._inflight: deque = deque()
+
+    def acquire(
+        self,
+        shape: tuple[int, ...],
+        dtype: Any,
+        device: str = "cpu",
+        pin_memory: bool = False,
+    ) -> Any:
+        """Get a tensor of the given shape/dtype backed by a pooled buffer.
+
+        Contents are uninitialized.
+        """
+        numel = 1
+        for dim in shape:
+            numel *= dim
+        nbytes = numel * torch.empty((), dtype=dtype).element_size()
+        bucket = 1 << max(nbytes - 1, 0).bit_length()
+
+        self._reclaim()
+        key = (bucket, str(torch.device(device)), pin_memory)
+        free = self._free[key]
+        if free:
+            buf = free.pop()
+        else:
+            buf = torch.empty(bucket, dtype=torch.uint8, device=device, pin_memory=pin_memory)
+
+        tensor = buf[:nbytes].view(dtype).view(shape)
+        tensor._pool_slot = (key, buf)
+        return tensor
+
+    def release(self, tensor: Any, event: Any = None) -> None:
+        """Return a tensor obtained from ``acquire`` to the pool.
+
+        If ``event`` (a CUDA event) is given, the buffer is only reused
+        once the event has completed, e.g. after an async copy out of it.
+        """
+        slot = getattr(tensor, "_pool_slot", None)
+        if slot is None:
+            return
+        del tensor._pool_slot
+        key, buf = slot
+        if event is not None:
+            self._inflight.append((event, key, buf))
+            return
+        free = self._free[key]
+        if len(free) < self.max_per_bucket:
+            free.append(buf)
+
+    def _reclaim(self) -> None:
+        """Move buffers whose async copies have finished back to the pool."""
+        while self._inflight and self._inflight[0][0].query():
+            _, key, buf = self._inflight.popleft()
+            free = self._free[key]
+            if len(free) < self.max_per_bucket:
+                free.append(buf)
+
+    def clear(self) -> None:
+        """Drop all idle pooled buffers."""
+        self._free.clear()
+
+
+# Shared pool for the conversion helpers below
+_pool = TensorPool()
+
+# Dedicated stream for host-to-device uploads, created on first use
+_transfer_stream = None
+
+
+def _get_transfer_stream() -> Any:
+    global _transfer_stream
+    if _transfer_stream is None:
+        _transfer_stream = torch.cuda.Stream()
+    return _transfer_stream
+
+
+def release_tensor(tensor: Any) -> None:
+    """Hand a tensor produced by ``arrow_to_tensor`` back for reuse."""
+    if TORCH_AVAILABLE:
+        _pool.release(tensor)
+
+
 def arrow_to_tensor(
     buffer: bytes,
     shape: tuple[int, ...],
@@ -47,27 +169,40 @@ def arrow_to_tensor(
     if not TORCH_AVAILABLE:
         raise ImportError("PyTorch is required for tensor operations")
 
-    # Map dtype string to torch dtype
-    dtype_map = {
-        "float32": torch.float32,
-        "float16": torch.float16,
-        "bfloat16": torch.bfloat16,
-        "int64": torch.int64,
-        "int32": torch.int32,
-        "uint8": torch.uint8,
-        "bool": torch.bool,
-    }
-
-    if dtype not in dtype_map:
-        raise ValueError(f"Unsupported dtype: {dtype}")
-    
-    torch_dtype = dtype_map[dtype]
+    if dtype == "float32":
+        torch_dtype, np_dtype, _ = _FLOAT32
+    else:
+        try:
+            torch_dtype, np_dtype, _ = _DTYPE_TABLE[dtype]
+        except KeyError:
+            raise ValueError(f"Unsupported dtype: {dtype}") from None
 
     # Create tensor from buffer (zero-copy if possible)
-    tensor = torch.frombuffer(buffer, dtype=torch_dtype).reshape(shape)
+    if np_dtype is not None:
+        tensor = torch.from_numpy(np.frombuffer(buffer, dtype=np_dtype).reshape(shape))
+    else:
+        tensor = torch.frombuffer(buffer, dtype=torch_dtype).reshape(shape)
 
     if device == "cuda" and torch.cuda.is_available():
-        tensor = tensor.cuda()
+        # Stage through a pooled pinned buffer, then upload asynchronously on
+        # the transfer stream into a pooled device tensor
+        host = _pool.acquire(shape, torch_dtype, pin_memory=True)
+        host.copy_(tensor)
+        tensor = _pool.acquire(shape, torch_dtype, device="cuda")
+
+        compute = torch.cuda.current_stream()
+        stream = _get_transfer_stream()
+        stream.wait_stream(compute)
+        with torch.cuda.stream(stream):
+            tensor.copy_(host, non_blocking=True)
+            copied = torch.cuda.Event()
+            copied.record()
+        tensor.record_stream(stream)
+
+        # Work queued on the compute stream sees the data without a host sync;
+        # the staging buffer is reused only after the copy completes
+        compute.wait_event(copied)
+        _pool.release(host, event=copied)
 
     return tensor
 
@@ -75,12 +210,16 @@ def arrow_to_tensor(
 def tensor_to_arrow(
     tensor: Any,
     copy: bool = False,
-) -> tuple[bytes, tuple[int, ...], str]:
+) -> tuple[memoryview | bytes, tuple[int, ...], str]:
     """Convert PyTorch tensor to Arrow-compatible buffer.
 
+    CPU tensors are exported as a byte ``memoryview`` over the tensor's own
+    storage (no copy); the view keeps the tensor alive. GPU tensors are
+    downloaded and returned as ``bytes``.
+
     Args:
         tensor: PyTorch tensor
-        copy: If True, always copy to CPU; otherwise use DLPack if possible
+        copy: If True, always return an independent ``bytes`` copy
 
     Returns:
         Tuple of (buffer, shape, dtype_str)
@@ -93,30 +232,26 @@ def tensor_to_arrow(
         tensor = tensor.contiguous()
 
     # Move to CPU if on GPU
+    staging = None
     if tensor.is_cuda:
-        if copy:
-            cpu_tensor = tensor.cpu()
-        else:
-            # Use DLPack for zero-copy (requires GPU accessible memory)
-            cpu_tensor = tensor.cpu()  # Simplified - DLPack path would be different
+        # Download into a pooled pinned buffer instead of a fresh pageable one
+        staging = _pool.acquire(tuple(tensor.shape), tensor.dtype, pin_memory=True)
+        staging.copy_(tensor)
+        cpu_tensor = staging
     else:
         cpu_tensor = tensor
 
-    # Get dtype string
-    dtype_map = {
-        torch.float32: "float32",
-        torch.float16: "float16",
-        torch.bfloat16: "bfloat16",
-        torch.int64: "int64",
-        torch.int32: "int32",
-        torch.uint8: "uint8",
-        torch.bool: "bool",
-    }
+    dtype_str = _DTYPE_NAMES.get(cpu_tensor.dtype, "float32")
 
-    dtype_str = dtype_map.get(cpu_tensor.dtype, "float32")
+    # Raw bytes of the storage; the uint8 view also covers dtypes NumPy lacks
+    buffer = memoryview(cpu_tensor.reshape(-1).view(torch.uint8).numpy())
 
-    # Get raw buffer
-    buffer = cpu_tensor.numpy().tobytes()
+    if staging is not None:
+        # The pinned staging buffer goes back to the pool, so copy out of it
+        buffer = buffer.tobytes()
+        _pool.release(staging)
+    elif copy:
+        buffer = buffer.tobytes()
 
     return buffer, tuple(tensor.shape), dtype_str
 
@@ -143,11 +278,15 @@ def tensor_to_dlpack(tensor: Any) -> Any:
     return torch.to_dlpack(tensor)
 
 
-def benchmark_transfer(size_mb: int = 1024) -> dict:
+BENCHMARK_DTYPES = ("float32", "bfloat16", "int8")
+
+
+def benchmark_transfer(size_mb: int = 1024, dtype: str = "float32") -> dict:
     """Benchmark tensor transfer throughput.
 
     Args:
         size_mb: Size of tensor in megabytes
+        dtype: Element type, one of BENCHMARK_DTYPES
 
     Returns:
         Dictionary with timing metrics
@@ -157,11 +296,18 @@ def benchmark_transfer(size_mb: int = 1024) -> dict:
     if not TORCH_AVAILABLE:
         return {"error": "PyTorch not available"}
 
-    results = {}
+    if dtype not in BENCHMARK_DTYPES:
+        raise ValueError(f"Unsupported benchmark dtype: {dtype}")
+
+    results = {"dtype": dtype}
 
     # Create test tensor
-    num_elements = (size_mb * 1024 * 1024) // 4  # float32
-    tensor = torch.randn(num_elements, dtype=torch.float32)
+    torch_dtype, _, itemsize = _DTYPE_TABLE[dtype]
+    num_elements = (size_mb * 1024 * 1024) // itemsize
+    if torch_dtype.is_floating_point:
+        tensor = torch.randn(num_elements, dtype=torch_dtype)
+    else:
+        tensor = torch.randint(-128, 128, (num_elements,), dtype=torch_dtype)
 
     # Test CPU -> bytes
     start = time.perf_counter()
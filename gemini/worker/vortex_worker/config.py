@@ -2,6 +2,7 @@
 
 import os
 import re
+import zlib
 from dataclasses import dataclass
 
 
@@ -16,8 +17,9 @@ def parse_slot_id(value: str) -> int:
     match = re.search(r"(\d+)$", value)
     if match:
         return int(match.group(1)) % 256  # Keep in byte range
-    # Hash-based fallback for non-numeric pod names
-    return hash(value) % 256
+    # Hash-based fallback for non-numeric pod names. CRC32 rather than hash(),
+    # which is salted per interpreter and would change the slot on restart.
+    return zlib.crc32(value.encode("utf-8")) & 0xFF
 
 
 @dataclass
@@ -28,6 +30,7 @@ class WorkerConfig:
     shm_name: str
     ipc_path: str
     debug: bool = False
+    executor_profile: str = ""  # JSON file of op type -> job count
 
     @classmethod
     def from_env(cls) -> "WorkerConfig":
@@ -38,4 +41,5 @@ class WorkerConfig:
             shm_name=os.getenv("VORTEX_SHM_NAME", "/vortex-shm"),
             ipc_path=os.getenv("VORTEX_IPC_PATH", "/tmp/vortex.sock"),  # nosec B108
             debug=os.getenv("VORTEX_DEBUG", "").lower() in ("1", "true"),
+            executor_profile=os.getenv("VORTEX_EXECUTOR_PROFILE", ""),
         )
@@ -4,16 +4,102 @@ Provides the AbstractExecutor base class and ExecutorRegistry for
 managing compute operations (nodes like KSampler, VAEDecode, etc).
 """
 
+import ctypes
+import ctypes.util
+import functools
+import json
 import logging
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from importlib.metadata import EntryPoint, entry_points
 from typing import Any
 
+from ._dlpack import DTYPE_CODES, to_capsule
+
 logger = logging.getLogger(__name__)
 
+# Entry point group executor packages declare their op types under
+ENTRY_POINT_GROUP = "vortex.executors"
+
+# Built-in executors, also declared in pyproject.toml; listed here so they
+# resolve when running from a source tree without installed metadata
+_BUILTIN_ENTRY_POINTS = {
+    op_type: EntryPoint(op_type, f"vortex_worker.nodes:{name}", ENTRY_POINT_GROUP)
+    for op_type, name in (
+        ("Loader::Checkpoint", "CheckpointLoader"),
+        ("Sampler::KSampler", "KSamplerExecutor"),
+        ("Decoder::VAE", "VAEDecodeExecutor"),
+        ("Encoder::CLIP", "CLIPTextEncode"),
+    )
+}
+
+
+@functools.cache
+def _torch() -> Any:
+    """torch, imported on first tensor access (None if not installed).
+
+    Kept out of module import so loading the registry and IPC layer does
+    not pay for importing torch.
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch
+
+
+# ═══════════════════════════════════════════════════════════════
+#                    TIMING
+# ═══════════════════════════════════════════════════════════════
+
+_CLOCK_MONOTONIC_RAW = 4  # Linux
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_clock_gettime():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    clock_gettime = libc.clock_gettime
+    clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(_Timespec)]
+    clock_gettime.restype = ctypes.c_int
+    return clock_gettime
+
+
+_clock_gettime = _load_clock_gettime()
+# One reusable timespec per thread: the ctypes call releases the GIL
+_tls = threading.local()
 
-@dataclass
+
+def _now_us() -> int:
+    """Monotonic microseconds from CLOCK_MONOTONIC_RAW.
+
+    Reads into a reused timespec and builds the value from seconds and
+    nanoseconds, avoiding a 64-bit nanosecond count and its // 1000.
+    Falls back to perf_counter_ns off Linux.
+    """
+    if _clock_gettime is None:
+        return time.perf_counter_ns() // 1000
+    try:
+        ts, ref = _tls.ts
+    except AttributeError:
+        ts = _Timespec()
+        ref = ctypes.byref(ts)
+        _tls.ts = (ts, ref)
+    _clock_gettime(_CLOCK_MONOTONIC_RAW, ref)
+    return ts.tv_sec * 1_000_000 + ts.tv_nsec // 1000
+
+
+@dataclass(slots=True)
 class TensorHandle:
     """Reference to a tensor in shared memory."""
 
@@ -23,7 +109,7 @@ class TensorHandle:
     device: str = "cuda"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of executing a node."""
 
@@ -43,6 +129,7 @@ class AbstractExecutor(ABC):
 
     # Class-level metadata
     OP_TYPE: str = ""
+    OP_ID: int = -1
     INPUT_TYPES: dict[str, str] = {}
     OUTPUT_TYPES: dict[str, str] = {}
 
@@ -67,174 +154,272 @@ class AbstractExecutor(ABC):
         pass
 
     def get_tensor(self, handle: TensorHandle):
-        """Load a tensor from shared memory."""
-        # Placeholder - will use DLPack in production
-        return None
+        """Load a tensor from shared memory.
+
+        The arena memory is handed to torch through a DLPack capsule, so
+        the returned CPU tensor aliases SHM without a copy. It is moved only
+        when ``handle.device`` is not the CPU. Handles that do not describe
+        a tensor (e.g. model references) return None.
+        """
+        torch = _torch()
+        if torch is None or handle.dtype not in DTYPE_CODES:
+            return None
+
+        nbytes = DTYPE_CODES[handle.dtype][1] // 8
+        for dim in handle.shape:
+            nbytes *= dim
+        if handle.offset < 0 or handle.offset + nbytes > self.shm.size:
+            raise ValueError(
+                f"Tensor at offset {handle.offset} ({nbytes} bytes) "
+                f"exceeds SHM arena of {self.shm.size} bytes"
+            )
+
+        # The view holds a buffer export on the mapping, so ShmArena.close()
+        # refuses to unmap it while the tensor is alive
+        view = memoryview(self.shm.mm)[handle.offset : handle.offset + nbytes]
+        capsule = to_capsule(
+            self.shm.base_ptr + handle.offset,
+            tuple(handle.shape),
+            handle.dtype,
+            owner=view,
+        )
+        tensor = torch.from_dlpack(capsule)
+        if handle.device != "cpu":
+            tensor = tensor.to(handle.device, non_blocking=True)
+        return tensor
 
     def put_tensor(self, tensor, device: str = "cuda") -> TensorHandle:
-        """Store a tensor in shared memory."""
-        # Placeholder - will use DLPack in production
-        return TensorHandle(offset=0, shape=tensor.shape, dtype=str(tensor.dtype))
+        """Store a tensor in shared memory.
+
+        Tensors that already live in the arena (e.g. written in place into a
+        view from ``get_tensor``) resolve to their offset without a copy.
+        """
+        dtype = str(tensor.dtype).removeprefix("torch.")
+        shape = tuple(tensor.shape)
+
+        if tensor.device.type == "cpu" and tensor.is_contiguous():
+            base = self.shm.base_ptr
+            ptr = tensor.data_ptr()
+            if base <= ptr and ptr + tensor.nbytes <= base + self.shm.size:
+                return TensorHandle(offset=ptr - base, shape=shape, dtype=dtype, device=device)
+
+        # Placeholder - not arena-backed; needs a copy into an arena allocation
+        return TensorHandle(offset=0, shape=shape, dtype=dtype, device=device)
 
 
 class ExecutorRegistry:
     """Registry for executor classes.
 
     Maps operation types (e.g., "Sampler::KSampler") to their
-    executor implementations.
+    executor implementations. Each op type is assigned a small integer
+    id at registration; dispatch indexes a list by that id instead of
+    hashing the op type string per job.
+
+    Executors are discovered through the ``vortex.executors`` entry point
+    group but only imported when their op type is first resolved, so
+    startup does not pay for the dependencies of unused executors.
     """
 
-    _executors: dict[str, type[AbstractExecutor]] = {}
+    _executors: list[type[AbstractExecutor]] = []
+    _op_type_to_id: dict[str, int] = {}
+    # Constructed executors, one per (arena, op id), reused across jobs
+    _instances: dict[tuple[int, int], AbstractExecutor] = {}
+    _instances_lock = threading.Lock()
+    # Discovered entry points by op type (None until first discovery)
+    _entry_points: dict[str, EntryPoint] | None = None
+    _load_lock = threading.Lock()
+    # Most frequent (op type, op id) pairs from a traffic profile, checked
+    # by string equality before the dict lookup (see load_profile)
+    _hot: tuple[tuple[str, int], ...] = ()
+
+    # Number of op types given the equality fast path
+    HOT_OP_TYPES = 4
 
     @classmethod
     def register(cls, op_type: str):
         """Decorator to register an executor class."""
 
         def decorator(executor_cls: type[AbstractExecutor]):
-            cls._executors[op_type] = executor_cls
-            executor_cls.OP_TYPE = op_type
-            logger.info(f"Registered executor: {op_type}")
+            op_type_interned = sys.intern(op_type)
+            op_id = cls._op_type_to_id.get(op_type_interned)
+            if op_id is None:
+                op_id = len(cls._executors)
+                cls._executors.append(executor_cls)
+                cls._op_type_to_id[op_type_interned] = op_id
+            else:
+                cls._executors[op_id] = executor_cls
+                cls._drop_instances(op_id)
+            executor_cls.OP_TYPE = op_type_interned
+            executor_cls.OP_ID = op_id
+            logger.info(f"Registered executor: {op_type} (id={op_id})")
             return executor_cls
 
         return decorator
 
+    @classmethod
+    def op_id(cls, op_type: str) -> int:
+        """Get the integer id for an operation type (-1 if unknown)."""
+        # op_type arrives as a fresh string per message; comparing against
+        # the few hottest types avoids hashing it for the common case
+        for hot_type, hot_id in cls._hot:
+            if op_type == hot_type:
+                return hot_id
+        op_id = cls._op_type_to_id.get(op_type)
+        if op_id is None:
+            return cls._load(op_type)
+        return op_id
+
+    @classmethod
+    def _discover(cls) -> dict[str, EntryPoint]:
+        """Collect executor entry points (built-ins, then installed packages)."""
+        if cls._entry_points is None:
+            discovered = dict(_BUILTIN_ENTRY_POINTS)
+            for ep in entry_points(group=ENTRY_POINT_GROUP):
+                discovered[ep.name] = ep
+            cls._entry_points = discovered
+        return cls._entry_points
+
+    @classmethod
+    def _load(cls, op_type: str) -> int:
+        """Import the executor for an op type on first use (-1 if unknown)."""
+        ep = cls._discover().get(op_type)
+        if ep is None:
+            return -1
+        with cls._load_lock:
+            op_id = cls._op_type_to_id.get(op_type)
+            if op_id is None:
+                executor_cls = ep.load()
+                # Loading usually registers via the decorator; register
+                # undecorated classes under their entry point name
+                op_id = cls._op_type_to_id.get(op_type)
+                if op_id is None:
+                    cls.register(op_type)(executor_cls)
+                    op_id = cls._op_type_to_id[op_type]
+        return op_id
+
+    @classmethod
+    def load_profile(cls, profile_json: str) -> list[str]:
+        """Rank op types by observed frequency for the dispatch fast path.
+
+        Args:
+            profile_json: JSON object mapping op type to job count
+
+        Returns:
+            The op types given the fast path, most frequent first
+
+        Raises:
+            ValueError: The profile is not valid JSON, not an object, or
+                has non-numeric counts
+        """
+        counts = json.loads(profile_json)
+        if not isinstance(counts, dict):
+            raise ValueError(f"expected a JSON object, got {type(counts).__name__}")
+        if not all(isinstance(n, int | float) for n in counts.values()):
+            raise ValueError("job counts must be numbers")
+        ranked = sorted(
+            (op_type for op_type in counts if cls.op_id(op_type) >= 0),
+            key=lambda op_type: counts[op_type],
+            reverse=True,
+        )[: cls.HOT_OP_TYPES]
+        cls._hot = tuple((op_type, cls._op_type_to_id[op_type]) for op_type in ranked)
+        logger.info(f"Executor dispatch profile: {ranked}")
+        return ranked
+
     @classmethod
     def get(cls, op_type: str) -> type[AbstractExecutor] | None:
         """Get executor class for an operation type."""
-        return cls._executors.get(op_type)
+        return cls.get_by_id(cls.op_id(op_type))
+
+    @classmethod
+    def get_by_id(cls, op_id: int) -> type[AbstractExecutor] | None:
+        """Get executor class by operation id."""
+        if 0 <= op_id < len(cls._executors):
+            return cls._executors[op_id]
+        return None
+
+    @classmethod
+    def get_instance(cls, op_id: int, shm_arena) -> AbstractExecutor | None:
+        """Get the executor instance for an op id, constructing it once per arena.
+
+        Executors are shared across jobs, so ``execute()`` must not keep
+        per-job state on the instance.
+        """
+        key = (id(shm_arena), op_id)
+        executor = cls._instances.get(key)
+        if executor is None:
+            executor_cls = cls.get_by_id(op_id)
+            if executor_cls is None:
+                return None
+            with cls._instances_lock:
+                executor = cls._instances.get(key)
+                if executor is None:
+                    executor = executor_cls(shm_arena)
+                    cls._instances[key] = executor
+        return executor
+
+    @classmethod
+    def clear_instances(cls, shm_arena=None) -> None:
+        """Drop cached executor instances (all, or those bound to one arena)."""
+        with cls._instances_lock:
+            if shm_arena is None:
+                cls._instances.clear()
+            else:
+                arena_id = id(shm_arena)
+                for key in [k for k in cls._instances if k[0] == arena_id]:
+                    del cls._instances[key]
+
+    @classmethod
+    def _drop_instances(cls, op_id: int) -> None:
+        with cls._instances_lock:
+            for key in [k for k in cls._instances if k[1] == op_id]:
+                del cls._instances[key]
 
     @classmethod
     def list(cls) -> list[str]:
-        """List all registered operation types."""
-        return list(cls._executors.keys())
+        """List all known operation types, loaded or not."""
+        op_types = list(cls._op_type_to_id.keys())
+        op_types += [t for t in cls._discover() if t not in cls._op_type_to_id]
+        return op_types
 
     @classmethod
     def execute_node(
         cls,
-        op_type: str,
+        op_id: int,
         inputs: dict[str, TensorHandle],
         params: dict[str, Any],
         shm_arena,
     ) -> ExecutionResult:
-        """Execute a node by operation type."""
-        executor_cls = cls.get(op_type)
-        if executor_cls is None:
+        """Execute a node by operation id (see ``op_id``)."""
+        executor = cls.get_instance(op_id, shm_arena)
+        if executor is None:
             return ExecutionResult(
                 success=False,
                 outputs={},
                 duration_us=0,
                 peak_vram_mb=0,
-                error=f"Unknown operation type: {op_type}",
+                error=f"Unknown operation id: {op_id}",
             )
 
-        executor = executor_cls(shm_arena)
-
-        start = time.perf_counter_ns()
+        start = _now_us()
         try:
             result = executor.execute(inputs, params)
-            result.duration_us = (time.perf_counter_ns() - start) // 1000
+            result.duration_us = _now_us() - start
             return result
         except Exception as e:
             logger.exception(f"Executor failed: {e}")
             return ExecutionResult(
                 success=False,
                 outputs={},
-                duration_us=(time.perf_counter_ns() - start) // 1000,
+                duration_us=_now_us() - start,
                 peak_vram_mb=0,
                 error=str(e),
             )
 
 
-# ═══════════════════════════════════════════════════════════════
-#                    EXAMPLE EXECUTORS
-# ═══════════════════════════════════════════════════════════════
-
-
-@ExecutorRegistry.register("Loader::Checkpoint")
-class CheckpointLoader(AbstractExecutor):
-    """Load a model checkpoint."""
-
-    INPUT_TYPES = {}
-    OUTPUT_TYPES = {"model": "MODEL", "clip": "CLIP", "vae": "VAE"}
-
-    def execute(self, inputs, params) -> ExecutionResult:
-        model_path = params.get("ckpt_name", "")
-        logger.info(f"Loading checkpoint: {model_path}")
-        # Placeholder - actual implementation would load the model
-        return ExecutionResult(
-            success=True,
-            outputs={
-                "model": TensorHandle(0, (), "model"),
-                "clip": TensorHandle(0, (), "clip"),
-                "vae": TensorHandle(0, (), "vae"),
-            },
-            duration_us=0,
-            peak_vram_mb=4096,
-        )
-
-
-@ExecutorRegistry.register("Sampler::KSampler")
-class KSamplerExecutor(AbstractExecutor):
-    """KSampler diffusion sampling."""
-
-    INPUT_TYPES = {
-        "model": "MODEL",
-        "positive": "CONDITIONING",
-        "negative": "CONDITIONING",
-        "latent": "LATENT",
-    }
-    OUTPUT_TYPES = {"samples": "LATENT"}
-
-    def execute(self, inputs, params) -> ExecutionResult:
-        steps = params.get("steps", 20)
-        cfg = params.get("cfg", 7.0)
-        sampler = params.get("sampler_name", "euler")
-        scheduler = params.get("scheduler", "normal")
-
-        logger.info(f"KSampler: steps={steps}, cfg={cfg}, sampler={sampler}")
-
-        # Placeholder - actual implementation would run diffusion
-        return ExecutionResult(
-            success=True,
-            outputs={"samples": TensorHandle(0, (1, 4, 64, 64), "float16")},
-            duration_us=0,
-            peak_vram_mb=2048,
-        )
-
-
-@ExecutorRegistry.register("Decoder::VAE")
-class VAEDecodeExecutor(AbstractExecutor):
-    """VAE decode latents to image."""
+def __getattr__(name: str):
+    # Built-in executors used to live in this module
+    if name in ("CheckpointLoader", "KSamplerExecutor", "VAEDecodeExecutor", "CLIPTextEncode"):
+        from . import nodes
 
-    INPUT_TYPES = {"samples": "LATENT", "vae": "VAE"}
-    OUTPUT_TYPES = {"image": "IMAGE"}
-
-    def execute(self, inputs, params) -> ExecutionResult:
-        logger.info("VAE decoding latents to image")
-
-        # Placeholder
-        return ExecutionResult(
-            success=True,
-            outputs={"image": TensorHandle(0, (1, 512, 512, 3), "uint8")},
-            duration_us=0,
-            peak_vram_mb=1024,
-        )
-
-
-@ExecutorRegistry.register("Encoder::CLIP")
-class CLIPTextEncode(AbstractExecutor):
-    """CLIP text encoding for conditioning."""
-
-    INPUT_TYPES = {"clip": "CLIP", "text": "STRING"}
-    OUTPUT_TYPES = {"conditioning": "CONDITIONING"}
-
-    def execute(self, inputs, params) -> ExecutionResult:
-        text = params.get("text", "")
-        logger.info(f"CLIP encoding: {text[:50]}...")
-
-        return ExecutionResult(
-            success=True,
-            outputs={"conditioning": TensorHandle(0, (1, 77, 768), "float16")},
-            duration_us=0,
-            peak_vram_mb=256,
-        )
+        return getattr(nodes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
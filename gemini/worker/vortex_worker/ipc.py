@@ -7,23 +7,53 @@ Protocol Specification:
 Uses the same protobuf schemas as the Rust host (vortex-protocol).
 """
 
+import ctypes
+import logging
+import os
+import selectors
 import socket
 import struct
+from array import array
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Optional, Dict, List, Any
+from typing import Any
+
+from .executor import ExecutorRegistry
 
 # Import generated protobuf classes
 from .generated import control
 
+logger = logging.getLogger(__name__)
+
+# Length prefix: u32 Big-Endian
+_HDR = struct.Struct(">I")
+
+# Buffers per writev() call
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
 
 @dataclass
 class Job:
-    """Job received from the Rust host (wrapper for JobRequest proto)."""
+    """Job received from the Rust host (wrapper for JobRequest proto).
+
+    Tensor inputs and output specs are stored as parallel arrays
+    (struct-of-arrays): entry i of each input_* field describes input i.
+    """
     job_id: str
     node_type: str
+    op_id: int  # ExecutorRegistry id for node_type (-1 if unregistered)
     params_json: bytes  # Raw JSON bytes from proto
-    inputs: Dict[str, Any]  # TensorInput mapping
-    outputs: List[Dict[str, Any]]  # Output specs
+    # TensorInput fields
+    input_names: list[str]
+    input_offsets: array  # 'Q'
+    input_sizes: array  # 'Q'
+    input_dtypes: array  # 'I'
+    input_shapes: list[tuple[int, ...]]
+    # OutputSpec fields
+    output_names: list[str]
+    output_dtypes: array  # 'I'
+    output_shapes: list[tuple[int, ...]]
 
 
 @dataclass
@@ -31,9 +61,230 @@ class JobResult:
     """Result to send back (wrapper for JobResult proto)."""
     job_id: str
     success: bool
-    outputs: List[Dict[str, Any]]
-    error: Optional[Dict[str, str]] = None
-    metrics: Optional[Dict[str, Any]] = None
+    outputs: list[dict[str, Any]]
+    error: dict[str, str] | None = None
+    metrics: dict[str, Any] | None = None
+
+
+# Decoded tensor fields, in Job field order from input_names onwards
+_TensorFields = tuple[
+    list[str], array, array, array, list[tuple[int, ...]],
+    list[str], array, list[tuple[int, ...]],
+]
+
+
+def _decode_tensors(request) -> _TensorFields:
+    """Generic decode of a JobRequest's tensor inputs and output specs."""
+    input_names: list[str] = []
+    input_offsets = array('Q')
+    input_sizes = array('Q')
+    input_dtypes = array('I')
+    input_shapes: list[tuple[int, ...]] = []
+    for tensor_input in request.inputs:
+        tensor = tensor_input.tensor
+        if tensor:
+            input_names.append(tensor_input.name)
+            input_offsets.append(tensor.offset)
+            input_sizes.append(tensor.size_bytes)
+            input_dtypes.append(tensor.dtype)
+            input_shapes.append(tuple(tensor.shape))
+
+    output_names: list[str] = []
+    output_dtypes = array('I')
+    output_shapes: list[tuple[int, ...]] = []
+    for spec in request.outputs:
+        output_names.append(spec.name)
+        output_dtypes.append(spec.dtype)
+        output_shapes.append(tuple(spec.expected_shape))
+
+    return (
+        input_names, input_offsets, input_sizes, input_dtypes, input_shapes,
+        output_names, output_dtypes, output_shapes,
+    )
+
+
+def _compile_decoder(op_id: int, inputs: list[str], outputs: list[str]) -> Callable:
+    """Generate a decoder specialized to one executor's declared schema.
+
+    The generated function reads each expected input/output by fixed index,
+    with no per-field loop. It returns None (caller falls back to
+    ``_decode_tensors``) if the message's names or counts differ.
+    """
+    n_in, n_out = len(inputs), len(outputs)
+    lines = [
+        f"def _decode_{op_id}(request):",
+        "    inputs = request.inputs",
+        "    outputs = request.outputs",
+        f"    if len(inputs) != {n_in} or len(outputs) != {n_out}:",
+        "        return None",
+    ]
+    for i, name in enumerate(inputs):
+        lines.append(f"    i{i} = inputs[{i}]")
+        lines.append(f"    if i{i}.name != {name!r}:")
+        lines.append("        return None")
+        lines.append(f"    t{i} = i{i}.tensor")
+    for i, name in enumerate(outputs):
+        lines.append(f"    o{i} = outputs[{i}]")
+        lines.append(f"    if o{i}.name != {name!r}:")
+        lines.append("        return None")
+
+    def seq(fmt: str, n: int) -> str:
+        return "".join(fmt.format(i=i) + ", " for i in range(n))
+
+    lines += [
+        "    return (",
+        f"        {list(inputs)!r},",
+        f"        array('Q', ({seq('t{i}.offset', n_in)})),",
+        f"        array('Q', ({seq('t{i}.size_bytes', n_in)})),",
+        f"        array('I', ({seq('t{i}.dtype', n_in)})),",
+        f"        [{seq('tuple(t{i}.shape)', n_in)}],",
+        f"        {list(outputs)!r},",
+        f"        array('I', ({seq('o{i}.dtype', n_out)})),",
+        f"        [{seq('tuple(o{i}.expected_shape)', n_out)}],",
+        "    )",
+    ]
+    namespace: dict[str, Any] = {"array": array}
+    exec(compile("\n".join(lines), f"<ipc-decoder-{op_id}>", "exec"), namespace)
+    return namespace[f"_decode_{op_id}"]
+
+
+# op id -> (executor class, specialized decoder), generated on first use
+_decoders: dict[int, tuple[type, Callable]] = {}
+
+
+def _get_decoder(op_id: int) -> Callable | None:
+    """Get (building if needed) the specialized decoder for an op id."""
+    executor_cls = ExecutorRegistry.get_by_id(op_id)
+    if executor_cls is None:
+        return None
+    entry = _decoders.get(op_id)
+    # Rebuild if the op type was re-registered with a different executor
+    if entry is None or entry[0] is not executor_cls:
+        decoder = _compile_decoder(
+            op_id, list(executor_cls.INPUT_TYPES), list(executor_cls.OUTPUT_TYPES)
+        )
+        entry = (executor_cls, decoder)
+        _decoders[op_id] = entry
+    return entry[1]
+
+
+# ═══════════════════════════════════════════════════════════════
+#                    FIXED-LAYOUT JOBS
+# ═══════════════════════════════════════════════════════════════
+
+CJOB_MAX_TENSORS = 16
+CJOB_MAX_DIMS = 8
+CJOB_ID_SIZE = 64
+CJOB_PARAMS_SIZE = 4096
+
+
+class CTensorRef(ctypes.Structure):
+    """Tensor input reference, or output spec (offset/size unused)."""
+
+    _fields_ = [
+        ("offset", ctypes.c_uint64),
+        ("size_bytes", ctypes.c_uint64),
+        ("dtype", ctypes.c_uint32),
+        ("ndim", ctypes.c_uint32),
+        ("shape", ctypes.c_uint32 * CJOB_MAX_DIMS),
+    ]
+
+
+class CJob(ctypes.Structure):
+    """Job as one fixed-size C struct with inline tensor arrays.
+
+    Tensors are stored in the order of the executor's INPUT_TYPES /
+    OUTPUT_TYPES; names are not carried. ``job_id`` and ``node_type`` read
+    like the Job dataclass fields, so either can be passed to process_job.
+    """
+
+    _fields_ = [
+        ("_job_id", ctypes.c_char * CJOB_ID_SIZE),
+        ("_node_type", ctypes.c_char * CJOB_ID_SIZE),
+        ("op_id", ctypes.c_int32),  # -1 if the node type is unregistered
+        ("num_inputs", ctypes.c_uint8),
+        ("num_outputs", ctypes.c_uint8),
+        ("params_len", ctypes.c_uint16),
+        ("params_json", ctypes.c_char * CJOB_PARAMS_SIZE),
+        ("inputs", CTensorRef * CJOB_MAX_TENSORS),
+        ("outputs", CTensorRef * CJOB_MAX_TENSORS),
+    ]
+
+    @property
+    def job_id(self) -> str:
+        return self._job_id.decode("utf-8")
+
+    @property
+    def node_type(self) -> str:
+        return self._node_type.decode("utf-8")
+
+    def params(self) -> bytes:
+        """The raw params JSON (the char array field itself stops at NUL)."""
+        return ctypes.string_at(ctypes.addressof(self) + CJob.params_json.offset, self.params_len)
+
+
+class CJobPool:
+    """Preallocated CJob structs reused across messages."""
+
+    def __init__(self, size: int = 8):
+        self.size = size
+        self._free: deque[CJob] = deque(CJob() for _ in range(size))
+
+    def acquire(self) -> CJob:
+        """Take a CJob from the pool (allocating only if it is empty)."""
+        return self._free.popleft() if self._free else CJob()
+
+    def release(self, cjob: CJob) -> None:
+        """Return a CJob to the pool."""
+        if len(self._free) < self.size:
+            self._free.append(cjob)
+
+
+def _fill_cjob(cjob: CJob, request, op_id: int) -> bool:
+    """Copy a JobRequest into a CJob; False if it exceeds the limits."""
+    job_id = request.job_id.encode("utf-8")
+    node_type = request.node_type.encode("utf-8")
+    params = request.params_json
+    inputs = request.inputs
+    outputs = request.outputs
+    if (
+        len(job_id) > CJOB_ID_SIZE
+        or len(node_type) > CJOB_ID_SIZE
+        or len(params) > CJOB_PARAMS_SIZE
+        or len(inputs) > CJOB_MAX_TENSORS
+        or len(outputs) > CJOB_MAX_TENSORS
+    ):
+        return False
+
+    for slot, tensor_input in zip(cjob.inputs, inputs):
+        tensor = tensor_input.tensor
+        shape = tensor.shape
+        if len(shape) > CJOB_MAX_DIMS:
+            return False
+        slot.offset = tensor.offset
+        slot.size_bytes = tensor.size_bytes
+        slot.dtype = tensor.dtype
+        slot.ndim = len(shape)
+        slot.shape[: len(shape)] = shape
+
+    for slot, spec in zip(cjob.outputs, outputs):
+        shape = spec.expected_shape
+        if len(shape) > CJOB_MAX_DIMS:
+            return False
+        slot.offset = 0
+        slot.size_bytes = 0
+        slot.dtype = spec.dtype
+        slot.ndim = len(shape)
+        slot.shape[: len(shape)] = shape
+
+    cjob._job_id = job_id
+    cjob._node_type = node_type
+    cjob.op_id = op_id
+    cjob.num_inputs = len(inputs)
+    cjob.num_outputs = len(outputs)
+    cjob.params_len = len(params)
+    ctypes.memmove(ctypes.addressof(cjob) + CJob.params_json.offset, params, len(params))
+    return True
 
 
 class IPCSocket:
@@ -44,24 +295,47 @@ class IPCSocket:
     - N bytes: protobuf-encoded message
     """
 
+    # Initial receive buffer size; grows to fit the largest message
+    RECV_BUFFER_SIZE = 64 * 1024
+    # Requested kernel SO_SNDBUF/SO_RCVBUF, sized for bursts of large messages
+    SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
     def __init__(self, path: str):
         self.path = path
-        self.sock: Optional[socket.socket] = None
+        self.sock: socket.socket | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._rx = bytearray(self.RECV_BUFFER_SIZE)
+        # Message instances reused across calls (Clear() before each use)
+        self._req = control.JobRequest()
+        self._res = control.JobResult()
+        self._hdr_buf = bytearray(_HDR.size)
 
     def connect(self) -> None:
         """Connect to the Rust host."""
         self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self.sock.connect(self.path)
-        self.sock.setblocking(False)
-        print(f"[IPC] Connected to {self.path}")
+        # AF_UNIX has no Nagle; socket buffer size is what throttles bursts.
+        # The kernel doubles the request and caps it at [wr]mem_max.
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+        # Readiness is polled through a selector (epoll on Linux) registered
+        # once; the socket stays blocking so reads complete in one call
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.sock, selectors.EVENT_READ)
+        sndbuf = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        rcvbuf = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        logger.info(f"Connected to {self.path} (sndbuf={sndbuf}, rcvbuf={rcvbuf})")
 
     def close(self) -> None:
         """Close the connection."""
+        if self._selector:
+            self._selector.close()
+            self._selector = None
         if self.sock:
             self.sock.close()
             self.sock = None
 
-    def receive(self, timeout_ms: int = 1000) -> Optional[Job]:
+    def receive(self, timeout_ms: int = 1000) -> Job | None:
         """Receive a job from the host.
 
         Returns None on timeout.
@@ -69,20 +343,78 @@ class IPCSocket:
         if not self.sock:
             raise RuntimeError("Socket not connected")
 
-        import select
+        if not self._selector.select(timeout_ms / 1000.0):
+            return None
+
+        return self.receive_ready()
+
+    def fileno(self) -> int:
+        """File descriptor of the connected socket, for external polling."""
+        if not self.sock:
+            raise RuntimeError("Socket not connected")
+        return self.sock.fileno()
+
+    def receive_ready(self) -> Job | None:
+        """Receive a job from a socket already known to be readable.
 
-        timeout_sec = timeout_ms / 1000.0
+        For callers that poll ``fileno()`` themselves. Returns None if the
+        host closed the connection or the message could not be decoded.
+        """
+        request = self._read_request()
+        if request is None:
+            return None
+        return self._to_job(request, ExecutorRegistry.op_id(request.node_type))
+
+    def receive_ready_cjob(self, pool: CJobPool) -> CJob | Job | None:
+        """Like ``receive_ready``, but decode into a pooled fixed-layout CJob.
 
-        ready, _, _ = select.select([self.sock], [], [], timeout_sec)
-        if not ready:
+        The caller returns a CJob with ``pool.release()`` once done. Jobs
+        exceeding the CJob limits are returned as a Job instead.
+        """
+        request = self._read_request()
+        if request is None:
             return None
 
+        op_id = ExecutorRegistry.op_id(request.node_type)
+        cjob = pool.acquire()
+        if _fill_cjob(cjob, request, op_id):
+            return cjob
+        pool.release(cjob)
+        return self._to_job(request, op_id)
+
+    def _to_job(self, request: Any, op_id: int) -> Job | None:
+        """Convert the parsed JobRequest to a Job; None on decode failure."""
+        try:
+            # Use the node type's specialized decoder when the message
+            # matches its declared schema
+            fields = None
+            decoder = _get_decoder(op_id)
+            if decoder is not None:
+                fields = decoder(request)
+            if fields is None:
+                fields = _decode_tensors(request)
+
+            job = Job(request.job_id, request.node_type, op_id, request.params_json, *fields)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Received job: {job.job_id} for node type: {job.node_type}")
+            return job
+
+        except Exception as e:
+            logger.exception(f"Decode error: {e}")
+            return None
+
+    def _read_request(self) -> Any | None:
+        """Read one frame and parse it into the reused JobRequest."""
+        if not self.sock:
+            raise RuntimeError("Socket not connected")
+
         # Read length prefix (4 bytes, Big-Endian)
-        length_bytes = self._recv_exact(4)
+        length_bytes = self._recv_exact(_HDR.size)
         if not length_bytes:
             return None
 
-        length = struct.unpack(">I", length_bytes)[0]
+        length = _HDR.unpack_from(length_bytes)[0]
 
         # Read message
         data = self._recv_exact(length)
@@ -91,43 +423,13 @@ class IPCSocket:
 
         # Decode protobuf message using generated class
         try:
-            request = control.JobRequest()
+            request = self._req
+            request.Clear()
+            # upb copies what it keeps, so the reusable buffer can be parsed in place
             request.ParseFromString(data)
-            
-            # Convert to Job wrapper
-            inputs = {}
-            for tensor_input in request.inputs:
-                if tensor_input.tensor:
-                    inputs[tensor_input.name] = {
-                        'offset': tensor_input.tensor.offset,
-                        'size_bytes': tensor_input.tensor.size_bytes,
-                        'dtype': tensor_input.tensor.dtype,
-                        'shape': list(tensor_input.tensor.shape),
-                    }
-            
-            outputs = []
-            for spec in request.outputs:
-                outputs.append({
-                    'name': spec.name,
-                    'dtype': spec.dtype,
-                    'expected_shape': list(spec.expected_shape),
-                })
-            
-            job = Job(
-                job_id=request.job_id,
-                node_type=request.node_type,
-                params_json=request.params_json,
-                inputs=inputs,
-                outputs=outputs,
-            )
-            
-            print(f"[IPC] Received job: {job.job_id} for node type: {job.node_type}")
-            return job
-            
+            return request
         except Exception as e:
-            print(f"[IPC] Decode error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Decode error: {e}")
             return None
 
     def send_result(self, result: JobResult) -> None:
@@ -136,7 +438,8 @@ class IPCSocket:
             raise RuntimeError("Socket not connected")
 
         # Create JobResult protobuf
-        proto_result = control.JobResult()
+        proto_result = self._res
+        proto_result.Clear()
         proto_result.job_id = result.job_id
         proto_result.success = result.success
         
@@ -169,9 +472,10 @@ class IPCSocket:
         data = proto_result.SerializeToString()
         
         # Send length prefix (Big-Endian) + data
-        length = struct.pack(">I", len(data))
-        self.sock.sendall(length + data)
-        print(f"[IPC] Sent result for job: {result.job_id}, success: {result.success}")
+        _HDR.pack_into(self._hdr_buf, 0, len(data))
+        self._send_frame(self._hdr_buf, data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sent result for job: {result.job_id}, success: {result.success}")
 
     def send_error(self, job_id: str, error: str) -> None:
         """Send error response to host."""
@@ -183,23 +487,43 @@ class IPCSocket:
         )
         self.send_result(result)
 
-    def _recv_exact(self, n: int) -> Optional[bytes]:
-        """Receive exactly n bytes."""
+    def _send_frame(self, *buffers: Any) -> None:
+        """Send buffers back to back in gathered writes.
+
+        os.writev() hands every buffer (length prefix, protobuf body, any
+        further segments) to the kernel in one syscall, so nothing is
+        concatenated in user space. Short writes resume from the byte
+        count returned.
+        """
+        fd = self.sock.fileno()
+        iov = [memoryview(buf) for buf in buffers]
+        while iov:
+            written = os.writev(fd, iov[:_IOV_MAX])
+            # Drop fully-written buffers and trim a partially-written one
+            while iov and written >= len(iov[0]):
+                written -= len(iov.pop(0))
+            if written:
+                iov[0] = iov[0][written:]
+
+    def _recv_exact(self, n: int) -> memoryview | None:
+        """Receive exactly n bytes into the reusable receive buffer.
+
+        The returned view is only valid until the next receive.
+        """
         if not self.sock:
             return None
 
-        data = bytearray()
-        while len(data) < n:
-            try:
-                chunk = self.sock.recv(n - len(data))
-                if not chunk:
-                    return None
-                data.extend(chunk)
-            except BlockingIOError:
-                # Would block, but we might have partial data
-                if len(data) == 0:
-                    return None
-                # Continue waiting for remaining bytes
-                continue
-
-        return bytes(data)
+        if n > len(self._rx):
+            self._rx = bytearray(n)
+        view = memoryview(self._rx)
+
+        received = 0
+        while received < n:
+            # MSG_WAITALL blocks until all n bytes arrive (short only on
+            # signals or EOF), replacing a recv() per partial chunk
+            count = self.sock.recv_into(view[received:n], n - received, socket.MSG_WAITALL)
+            if not count:
+                return None
+            received += count
+
+        return view[:n]
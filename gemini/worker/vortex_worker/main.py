@@ -7,17 +7,84 @@ compute jobs using the shared memory arena.
 Protocol: Protobuf over UDS with Big-Endian length prefix
 """
 
+import ctypes
+import ctypes.util
 import logging
+import os
+import select
 import signal
 import sys
-from typing import NoReturn, Optional
+import time
+from collections.abc import Callable
+from typing import NoReturn
 
 from .config import WorkerConfig
-from .ipc import IPCSocket, Job, JobResult
+from .executor import ExecutorRegistry
+from .ipc import CJob, CJobPool, IPCSocket, Job, JobResult
 from .shm import ShmArena
 
 logger = logging.getLogger(__name__)
 
+# Matches HEARTBEAT_INTERVAL_MS in vortex-protocol
+HEARTBEAT_INTERVAL_MS = 1000
+
+
+# ═══════════════════════════════════════════════════════════════
+#                    HEARTBEAT TIMER
+# ═══════════════════════════════════════════════════════════════
+
+_CLOCK_MONOTONIC = 1
+_TFD_NONBLOCK = os.O_NONBLOCK
+_TFD_CLOEXEC = os.O_CLOEXEC
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+class HeartbeatTimer:
+    """Periodic timerfd on CLOCK_MONOTONIC, pollable alongside the socket."""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    @classmethod
+    def create(cls, interval_ms: int) -> "HeartbeatTimer | None":
+        """Create an armed timer, or None where timerfd is unavailable."""
+        if not hasattr(select, "epoll"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.timerfd_create(_CLOCK_MONOTONIC, _TFD_NONBLOCK | _TFD_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "timerfd_create failed")
+            period = _Timespec(interval_ms // 1000, (interval_ms % 1000) * 1_000_000)
+            spec = _Itimerspec(period, period)
+            if libc.timerfd_settime(fd, 0, ctypes.byref(spec), None) < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), "timerfd_settime failed")
+        except (OSError, AttributeError) as e:
+            logger.warning(f"timerfd unavailable ({e}) - using poll timeouts for heartbeat")
+            return None
+        return cls(fd)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def ack(self) -> int:
+        """Consume pending expirations; returns how many have elapsed."""
+        try:
+            return int.from_bytes(os.read(self._fd, 8), sys.byteorder)
+        except BlockingIOError:
+            return 0
+
+    def close(self) -> None:
+        os.close(self._fd)
+
 
 def setup_logging(config: WorkerConfig) -> None:
     """Configure structured logging."""
@@ -29,6 +96,18 @@ def setup_logging(config: WorkerConfig) -> None:
     )
 
 
+def check_protobuf_runtime() -> str:
+    """Log which protobuf runtime is active, warning if it is pure Python."""
+    from google.protobuf.internal import api_implementation
+
+    impl = api_implementation.Type()
+    if impl in ("upb", "cpp"):
+        logger.info(f"Protobuf runtime: {impl}")
+    else:
+        logger.warning(f"Protobuf runtime is '{impl}'; IPC decoding will be slow")
+    return impl
+
+
 def main() -> NoReturn:
     """Main worker entry point."""
     # Load configuration from environment
@@ -36,6 +115,13 @@ def main() -> NoReturn:
     setup_logging(config)
 
     logger.info(f"VORTEX Worker starting (slot={config.slot_id})")
+    check_protobuf_runtime()
+    if config.executor_profile:
+        try:
+            with open(config.executor_profile) as f:
+                ExecutorRegistry.load_profile(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring executor profile {config.executor_profile}: {e}")
 
     # Setup signal handlers
     shutdown = False
@@ -59,12 +145,12 @@ def main() -> NoReturn:
             shm = ShmArena(config.shm_name)
             logger.info(f"Connected to existing SHM arena: {config.shm_name}")
 
-        # Register worker slot
-        shm.register_worker(config.slot_id)
+        # Register worker slot; heartbeats are stored straight into the slot
+        heartbeat = shm.register_worker(config.slot_id)
         shm.set_status(config.slot_id, 2)  # IDLE
 
         # Try to connect to IPC socket
-        ipc: Optional[IPCSocket] = None
+        ipc: IPCSocket | None = None
         try:
             ipc = IPCSocket(config.ipc_path)
             ipc.connect()
@@ -78,42 +164,32 @@ def main() -> NoReturn:
 
         # Main event loop
         logger.info("Entering main event loop")
+        timer = HeartbeatTimer.create(HEARTBEAT_INTERVAL_MS) if ipc is not None else None
+        if timer is not None:
+            run_epoll_loop(ipc, timer, heartbeat, shm, config, lambda: shutdown)
+            timer.close()
+            if not shutdown:
+                # Host went away; keep heartbeating in standalone mode
+                ipc.close()
+                ipc = None
+
         while not shutdown:
-            # Update heartbeat
-            shm.update_heartbeat(config.slot_id)
+            # Update heartbeat (Unix timestamp ms)
+            heartbeat[0] = shm.now_ms()
 
             # If no IPC, just keep heartbeat alive
             if ipc is None:
-                import time
                 time.sleep(1)
                 continue
 
             # Wait for job from host
-            job = ipc.receive(timeout_ms=1000)
+            job = ipc.receive(timeout_ms=HEARTBEAT_INTERVAL_MS)
 
             if job is None:
                 # No job, continue heartbeat polling
                 continue
 
-            logger.info(f"Received job: {job.job_id} for node type: {job.node_type}")
-
-            # Mark as busy
-            shm.set_status(config.slot_id, 3)  # BUSY
-
-            try:
-                # Execute the job
-                result = execute_job(job, shm)
-                
-                # Send result back
-                ipc.send_result(result)
-                logger.info(f"Job completed: {job.job_id}")
-                
-            except Exception as e:
-                logger.error(f"Job failed: {e}")
-                shm.set_status(config.slot_id, 4)  # ERROR
-                ipc.send_error(job.job_id, str(e))
-            finally:
-                shm.set_status(config.slot_id, 2)  # IDLE
+            process_job(job, ipc, shm, config)
 
         logger.info("Worker shutdown complete")
 
@@ -124,7 +200,107 @@ def main() -> NoReturn:
     sys.exit(0)
 
 
-def execute_job(job: Job, shm: ShmArena) -> JobResult:
+def process_job(job: Job | CJob, ipc: IPCSocket, shm: ShmArena, config: WorkerConfig) -> None:
+    """Run one job and report its result, tracking slot status around it."""
+    logger.info(f"Received job: {job.job_id} for node type: {job.node_type}")
+
+    # Mark as busy
+    shm.set_status(config.slot_id, 3)  # BUSY
+
+    try:
+        # Execute the job
+        result = execute_job(job, shm)
+
+        # Send result back
+        ipc.send_result(result)
+        logger.info(f"Job completed: {job.job_id}")
+
+    except Exception as e:
+        logger.error(f"Job failed: {e}")
+        shm.set_status(config.slot_id, 4)  # ERROR
+        ipc.send_error(job.job_id, str(e))
+    finally:
+        shm.set_status(config.slot_id, 2)  # IDLE
+
+
+def idle_until_readable(
+    ep: "select.epoll",
+    timer: "HeartbeatTimer",
+    heartbeat: memoryview,
+    clock_ms: Callable[[], int],
+    should_stop: Callable[[], bool],
+) -> int:
+    """Block until the IPC socket is readable, heartbeating meanwhile.
+
+    The GIL is released for the whole epoll_wait; Python only runs once per
+    heartbeat tick to store the timestamp. Everything the loop touches is
+    bound to a local up front so a tick is a handful of bytecodes.
+
+    Returns:
+        The socket's epoll event mask, or 0 if ``should_stop`` became true
+    """
+    poll = ep.poll
+    timer_fd = timer.fileno()
+    ack = timer.ack
+    timeout = HEARTBEAT_INTERVAL_MS / 1000.0
+
+    while not should_stop():
+        socket_events = 0
+        for fd, events in poll(timeout):
+            if fd == timer_fd:
+                # The timerfd is level-triggered: it stays readable (and
+                # epoll keeps returning it) until the expirations are read
+                ack()
+                heartbeat[0] = clock_ms()
+            else:
+                socket_events = events
+        if socket_events:
+            return socket_events
+    return 0
+
+
+def run_epoll_loop(
+    ipc: IPCSocket,
+    timer: "HeartbeatTimer",
+    heartbeat: memoryview,
+    shm: ShmArena,
+    config: WorkerConfig,
+    should_stop: Callable[[], bool],
+) -> None:
+    """Multiplex the IPC socket and the heartbeat timer on one epoll.
+
+    Heartbeats are written when the timerfd fires, independent of socket
+    traffic, and jobs are read as soon as the socket is readable. Jobs are
+    decoded into pooled CJob structs, so steady-state receives allocate no
+    per-job containers.
+    """
+    pool = CJobPool()
+    ep = select.epoll()
+    ep.register(timer.fileno(), select.EPOLLIN)
+    ep.register(ipc.fileno(), select.EPOLLIN | select.EPOLLRDHUP)
+
+    try:
+        while True:
+            events = idle_until_readable(ep, timer, heartbeat, shm.now_ms, should_stop)
+            if not events:
+                return
+
+            job = ipc.receive_ready_cjob(pool)
+            if isinstance(job, CJob):
+                try:
+                    process_job(job, ipc, shm, config)
+                finally:
+                    pool.release(job)
+            elif job is not None:
+                process_job(job, ipc, shm, config)
+            elif events & (select.EPOLLHUP | select.EPOLLRDHUP):
+                logger.warning("IPC connection closed by host")
+                return
+    finally:
+        ep.close()
+
+
+def execute_job(job: Job | CJob, shm: ShmArena) -> JobResult:
     """Execute a compute job.
     
     This is the main execution entry point. It:
@@ -152,7 +328,6 @@ def execute_job(job: Job, shm: ShmArena) -> JobResult:
     # 6. Return JobResult with output refs
     
     # For now, stub implementation
-    import time
     time.sleep(0.1)  # Simulate work
     
     return JobResult(
@@ -6,11 +6,19 @@ Provides HuggingFace Hub integration for loading models, including:
 - Model caching and management
 """
 
+import functools
+import json
 import logging
 import os
+import struct
+import threading
+import types
+from collections import ChainMap
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +86,142 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
     ),
 }
 
+# Read-only view shared by all loaders; per-loader additions go in front
+# of it (see ModelLoader.catalog) instead of into a copy
+_CATALOG = types.MappingProxyType(MODEL_CATALOG)
+
+
+# ═══════════════════════════════════════════════════════════════
+#                    SAFETENSORS INDEX
+# ═══════════════════════════════════════════════════════════════
+
+# safetensors dtype -> torch dtype name
+_ST_DTYPE_NAMES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "U16": "uint16",
+    "U32": "uint32",
+    "U64": "uint64",
+    "F8_E4M3": "float8_e4m3fn",
+    "F8_E5M2": "float8_e5m2",
+    "BOOL": "bool",
+}
+
+
+class _TorchDtypes(dict):
+    # Resolves torch dtypes on first use so importing this module does not
+    # import torch. Maps to None when the installed torch lacks the dtype
+    # (or the name is unknown), so callers can fall back to safetensors
+    def __missing__(self, key: str) -> Any:
+        import torch
+
+        dtype = getattr(torch, _ST_DTYPE_NAMES.get(key, ""), None)
+        self[key] = dtype
+        return dtype
+
+
+_ST_TORCH_DTYPES = _TorchDtypes()
+
+
+class MappedStateDict(dict):
+    """State dict whose tensors are views into ``self.mmap``.
+
+    Holding the mapping here keeps it alive as long as the dict.
+    """
+
+    def __init__(self, mm: Any):
+        super().__init__()
+        self.mmap = mm
+
+
+@functools.lru_cache(maxsize=64)
+def _read_index(path: str, mtime_ns: int, size: int) -> tuple[int, dict[str, Any]]:
+    # mtime/size are part of the cache key so a rewritten file is re-read
+    with open(path, "rb") as f:
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len))
+    header.pop("__metadata__", None)
+    return 8 + header_len, header
+
+
+def safetensors_index(path: str) -> tuple[int, dict[str, Any]]:
+    """Parse (once per file version) a safetensors header.
+
+    Returns:
+        (offset of the data section, {key: {"dtype", "shape", "data_offsets"}})
+    """
+    stat = os.stat(path)
+    return _read_index(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+# ═══════════════════════════════════════════════════════════════
+#                    LAZY CHECKPOINT
+# ═══════════════════════════════════════════════════════════════
+
+
+class LazyCheckpoint(Mapping):
+    """Read-only state dict over a safetensors file, loading on access.
+
+    Keeps one ``safe_open`` handle (which memory-maps the file) for its
+    lifetime; each tensor is materialized on first lookup and cached, so
+    host memory only grows by the tensors actually used.
+    """
+
+    def __init__(self, path: str, device: str = "cpu"):
+        from safetensors import safe_open
+
+        self.path = path
+        self.device = device
+        self._handle = safe_open(path, framework="pt", device=device)
+        self._file = self._handle.__enter__()
+        self._keys = list(self._file.keys())
+        self._key_set = frozenset(self._keys)
+        self._cache: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        tensor = self._cache.get(key)
+        if tensor is None:
+            if self._file is None:
+                raise RuntimeError(f"Checkpoint closed: {self.path}")
+            if key not in self._key_set:
+                raise KeyError(key)
+            tensor = self._file.get_tensor(key)
+            self._cache[key] = tensor
+        return tensor
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set
+
+    def prefetch(self, keys: list[str]) -> None:
+        """Load the given tensors now rather than on first access."""
+        for key in keys:
+            self[key]
+
+    def close(self) -> None:
+        """Release the file handle; cached tensors stay valid."""
+        if self._file is not None:
+            self._handle.__exit__(None, None, None)
+            self._file = None
+
+    def __enter__(self) -> "LazyCheckpoint":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
 
 # ═══════════════════════════════════════════════════════════════
 #                    MODEL LOADER
@@ -95,7 +239,23 @@ class ModelLoader:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.loaded_models: dict[str, Any] = {}
-        self.catalog = MODEL_CATALOG.copy()
+        # Per-component weight format of quantized pipelines, by model ID
+        self.quant_meta: dict[str, dict[str, str]] = {}
+        # MB of weights unloaded since the CUDA cache was last trimmed
+        self._unload_pressure_mb = 0
+        # Writes land in _overrides; lookups fall back to the shared catalog
+        self._overrides: dict[str, ModelInfo] = {}
+        self.catalog = ChainMap(self._overrides, _CATALOG)
+
+        # Background loads, one at a time, by model ID while in flight
+        self._local = threading.local()
+        self._prefetch_pool = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="model-prefetch",
+            initializer=self._mark_prefetch_thread,
+        )
+        self._pending: dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
 
         logger.info(f"ModelLoader initialized, cache: {self.cache_dir}")
 
@@ -118,16 +278,39 @@ class ModelLoader:
         self,
         model_id: str,
         device: str = "cuda",
-        dtype: str = "float16",
+        dtype: str | None = None,
         variant: str | None = "fp16",
+        quantization: Literal["none", "int8", "fp8", "nf4"] = "none",
+        offload: Literal["none", "model", "sequential", "group"] = "none",
+        device_map: str | dict[str, Any] | None = None,
+        compile: bool = False,
     ) -> Any:
         """Load a diffusers pipeline.
 
         Args:
             model_id: Model key from catalog or HuggingFace repo ID
             device: Target device (cuda, cpu, mps)
-            dtype: Model dtype (float16, float32, bfloat16)
+            dtype: Model dtype (float16, float32, bfloat16). Defaults to
+                bfloat16 on CUDA devices with compute capability 8.0+
+                (same 2 bytes per weight as float16, without its overflow
+                risk), float16 otherwise.
             variant: Weight variant (fp16, etc.)
+            quantization: Weight quantization for the denoiser (UNet or
+                transformer): nf4 via bitsandbytes at load time, int8/fp8
+                via optimum-quanto after load. Norm and embedding layers,
+                the VAE and text encoders keep ``dtype``.
+            offload: CPU offload instead of moving the whole pipeline to
+                CUDA: per-model, per-submodule (sequential), or per-block
+                groups streamed ahead of use. Requires CUDA.
+            device_map: Placement across devices ("balanced", "auto" or an
+                explicit map) forwarded to from_pretrained, filling each GPU
+                up to MAX_MEMORY_FRACTION of its free memory. Replaces both
+                ``device`` and ``offload``.
+            compile: Compile the denoiser with torch.compile (CUDA graphs,
+                static shapes) and allow TF32 matmuls. Off by default since
+                the first generation pays the compile time. Ignored with
+                offload or device_map, whose hooks move weights between
+                steps.
 
         Returns:
             Loaded diffusers pipeline
@@ -137,6 +320,22 @@ class ModelLoader:
             logger.info(f"Using cached model: {model_id}")
             return self.loaded_models[model_id]
 
+        # Register the load so concurrent callers and prefetches wait for
+        # it; on the prefetch thread, prefetch() has registered it already
+        own: Future | None = None
+        if not self._on_prefetch_thread():
+            with self._pending_lock:
+                # A load may have finished since the unlocked check above
+                cached = self.loaded_models.get(model_id)
+                pending = self._pending.get(model_id)
+                if cached is None and pending is None:
+                    own = self._pending[model_id] = Future()
+            if cached is not None:
+                return cached
+            if own is None:
+                logger.info(f"Waiting for in-flight load of {model_id}")
+                return pending.result()
+
         # Get model info
         info = self.catalog.get(model_id)
         repo_id = info.id if info else model_id
@@ -153,59 +352,398 @@ class ModelLoader:
                 "float32": torch.float32,
                 "bfloat16": torch.bfloat16,
             }
+            if dtype is None:
+                dtype = self._default_dtype(device)
             torch_dtype = dtype_map.get(dtype, torch.float16)
 
-            # Load pipeline
-            pipe = AutoPipelineForText2Image.from_pretrained(
-                repo_id,
-                torch_dtype=torch_dtype,
-                variant=variant,
-                cache_dir=str(self.cache_dir),
-            )
-
-            # Move to device
-            if device == "cuda" and torch.cuda.is_available():
-                pipe = pipe.to("cuda")
-            elif device == "mps" and hasattr(torch.backends, "mps"):
-                pipe = pipe.to("mps")
-            else:
-                pipe = pipe.to("cpu")
+            def build() -> Any:
+                load_kwargs: dict[str, Any] = {}
+                if quantization == "nf4":
+                    load_kwargs["quantization_config"] = self._nf4_config(repo_id)
+                if device_map is not None:
+                    load_kwargs["device_map"] = device_map
+                    load_kwargs["max_memory"] = self._max_memory()
+
+                # Load pipeline
+                pipe = AutoPipelineForText2Image.from_pretrained(
+                    repo_id,
+                    torch_dtype=torch_dtype,
+                    variant=variant,
+                    cache_dir=str(self.cache_dir),
+                    **load_kwargs,
+                )
+
+                if quantization in ("int8", "fp8"):
+                    self._quantize_denoiser(pipe, quantization)
+                if quantization != "none":
+                    self.quant_meta[model_id] = self._component_formats(pipe)
+                    formats = self.quant_meta[model_id]
+                    logger.info(f"Quantized {model_id} ({quantization}): {formats}")
+
+                # Move to device (dispatched pipelines and offload hooks manage
+                # placement themselves)
+                if device_map is not None:
+                    pass
+                elif offload != "none" and torch.cuda.is_available():
+                    self._apply_offload(pipe, offload)
+                elif device == "cuda" and torch.cuda.is_available():
+                    if not self._on_device(pipe, "cuda"):
+                        # Prefetch uploads on a side stream so they do not
+                        # queue behind the inference on the default stream
+                        stream = torch.cuda.Stream() if self._on_prefetch_thread() else None
+                        with torch.cuda.stream(stream):
+                            pipe = pipe.to("cuda")
+                        if stream is not None:
+                            stream.synchronize()
+                elif device == "mps" and torch.backends.mps.is_available():
+                    if not self._on_device(pipe, "mps"):
+                        pipe = pipe.to("mps")
+                elif not self._on_device(pipe, "cpu"):
+                    pipe = pipe.to("cpu")
+
+                if torch.cuda.is_available() and (
+                    device == "cuda" or offload != "none" or device_map is not None
+                ):
+                    self._enable_xformers(pipe)
+                if compile:
+                    if offload == "none" and device_map is None:
+                        self._compile_denoiser(pipe)
+                    else:
+                        logger.warning("compile=True ignored for offloaded or dispatched pipelines")
+                return pipe
+
+            try:
+                pipe = build()
+            except torch.cuda.OutOfMemoryError:
+                # Blocks freed by earlier unloads may still be cached
+                if not self._unload_pressure_mb:
+                    raise
+                logger.warning(
+                    f"Out of memory loading {model_id}; trimming CUDA cache and retrying"
+                )
+                self._trim_cache(force=True)
+                pipe = build()
 
             # Cache the loaded model
             self.loaded_models[model_id] = pipe
 
             logger.info(f"Model loaded successfully: {model_id}")
+            if own is not None:
+                own.set_result(pipe)
             return pipe
 
         except ImportError as e:
             logger.error(f"Missing dependency: {e}")
+            if own is not None:
+                own.set_exception(e)
             raise
         except Exception as e:
             logger.error(f"Failed to load model {model_id}: {e}")
+            if own is not None:
+                own.set_exception(e)
             raise
+        finally:
+            if own is not None:
+                with self._pending_lock:
+                    self._pending.pop(model_id, None)
+                if not own.done():
+                    own.set_exception(RuntimeError(f"Loading {model_id} was interrupted"))
+
+    def prefetch(self, model_id: str, **kwargs: Any) -> Future:
+        """Load a pipeline in the background, e.g. while another one runs.
+
+        Call it with the next job's model before ``generate_image`` on the
+        current one, so the load overlaps the denoising loop. Loads of the
+        same model are shared: a later ``load_pipeline`` waits for this one,
+        and prefetching a model that is already loading returns that load.
+
+        Args:
+            model_id: Model key from catalog or HuggingFace repo ID
+            **kwargs: Further ``load_pipeline`` arguments
+
+        Returns:
+            Future resolving to the loaded pipeline
+        """
+        with self._pending_lock:
+            cached = self.loaded_models.get(model_id)
+            pending = self._pending.get(model_id)
+            if cached is None and pending is None:
+                pending = self._prefetch_pool.submit(self._run_prefetch, model_id, kwargs)
+                self._pending[model_id] = pending
+        if cached is not None:
+            done: Future = Future()
+            done.set_result(cached)
+            return done
+        return pending
+
+    def _mark_prefetch_thread(self) -> None:
+        self._local.prefetch = True
+
+    def _on_prefetch_thread(self) -> bool:
+        return getattr(self._local, "prefetch", False)
+
+    def _run_prefetch(self, model_id: str, kwargs: dict[str, Any]) -> Any:
+        try:
+            return self.load_pipeline(model_id, **kwargs)
+        finally:
+            with self._pending_lock:
+                self._pending.pop(model_id, None)
+
+    # Pipeline components holding the denoising network
+    DENOISER_COMPONENTS = ("unet", "transformer")
+    # Module name patterns left unquantized
+    QUANT_EXCLUDE = ["*norm*", "*emb*"]
+
+    # Unloaded weights (MB) the CUDA caching allocator may hold before
+    # unload() trims it
+    EMPTY_CACHE_THRESHOLD_MB = 2048
+
+    # Share of each device's free memory a device_map may fill
+    MAX_MEMORY_FRACTION = 0.85
+    # Share of available host memory that offloaded weights may pin
+    # (pinned pages cannot be swapped out)
+    PIN_MEMORY_FRACTION = 0.5
+
+    @staticmethod
+    def _available_host_memory() -> int | None:
+        """Available physical host memory in bytes, if it can be queried."""
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError, AttributeError):
+            return None
+
+    @classmethod
+    def _max_memory(cls) -> dict[int | str, int]:
+        """Per-device memory budget (bytes) for device_map placement."""
+        import torch
+
+        budget: dict[int | str, int] = {}
+        if torch.cuda.is_available():
+            for index in range(torch.cuda.device_count()):
+                free, _total = torch.cuda.mem_get_info(index)
+                budget[index] = int(free * cls.MAX_MEMORY_FRACTION)
+        available = cls._available_host_memory()
+        if available is not None:
+            budget["cpu"] = int(available * cls.MAX_MEMORY_FRACTION)
+        return budget
+
+    def _apply_offload(self, pipe: Any, offload: str) -> None:
+        """Install CPU offload hooks so only the active part sits in VRAM."""
+        if offload == "model":
+            pipe.enable_model_cpu_offload()
+        elif offload == "sequential":
+            # The offload hooks copy each submodule's weights from the CPU
+            # tensors on every step; pinned sources make those copies DMA
+            # straight from host memory instead of via a staging buffer
+            self._pin_weights(pipe)
+            pipe.enable_sequential_cpu_offload()
+        elif offload == "group":
+            import torch
+            from diffusers.hooks import apply_group_offloading
+
+            for component in pipe.components.values():
+                if isinstance(component, torch.nn.Module):
+                    apply_group_offloading(
+                        component,
+                        onload_device=torch.device("cuda"),
+                        offload_device=torch.device("cpu"),
+                        offload_type="block_level",
+                        num_blocks_per_group=1,
+                        use_stream=True,
+                    )
+        else:
+            raise ValueError(f"Unknown offload mode: {offload}")
+
+    @staticmethod
+    def _on_device(pipe: Any, device_type: str) -> bool:
+        """Whether every module component already sits on ``device_type``.
+
+        Used to skip ``pipe.to()``, which walks and dispatches for every
+        parameter even when nothing has to move. All components are checked
+        because some (e.g. a bitsandbytes-quantized denoiser) are placed at
+        load time while the rest of the pipeline is not. Components move as
+        a whole, so one tensor per component stands for the rest.
+        """
+        import torch
+
+        for component in getattr(pipe, "components", {}).values():
+            if isinstance(component, torch.nn.Module):
+                tensor = next(component.parameters(), None)
+                if tensor is None:
+                    tensor = next(component.buffers(), None)
+                if tensor is not None and tensor.device.type != device_type:
+                    return False
+        return True
+
+    @staticmethod
+    def _default_dtype(device: str) -> str:
+        """bfloat16 on Ampere or newer GPUs, float16 elsewhere."""
+        import torch
+
+        if device == "cuda" and torch.cuda.is_available():
+            if torch.cuda.get_device_capability(0) >= (8, 0):
+                logger.info("Using bf16 (2 bytes/weight) vs fp32 (4 bytes)")
+                return "bfloat16"
+        return "float16"
+
+    def _pin_weights(self, pipe: Any) -> int:
+        """Move CPU parameters and buffers into page-locked memory.
+
+        Skipped when the weights exceed PIN_MEMORY_FRACTION of available
+        host memory.
+
+        Returns:
+            Bytes pinned
+        """
+        import torch
+
+        tensors = [
+            tensor
+            for component in pipe.components.values()
+            if isinstance(component, torch.nn.Module)
+            for tensor in (*component.parameters(), *component.buffers())
+            if tensor.device.type == "cpu" and not tensor.is_pinned()
+        ]
+        nbytes = sum(t.numel() * t.element_size() for t in tensors)
+
+        available = self._available_host_memory()
+        if available is not None and nbytes > available * self.PIN_MEMORY_FRACTION:
+            logger.warning(f"Not pinning {nbytes >> 20} MB of weights: exceeds host budget")
+            return 0
+
+        try:
+            for tensor in tensors:
+                tensor.data = tensor.data.pin_memory()
+        except RuntimeError as e:
+            logger.warning(f"Pinning weights failed: {e}")
+            return 0
+        logger.info(f"Pinned {nbytes >> 20} MB of offloaded weights")
+        return nbytes
+
+    @classmethod
+    def _compile_denoiser(cls, pipe: Any) -> None:
+        """Wrap the UNet/transformer in torch.compile with CUDA graphs."""
+        import torch
+
+        if not hasattr(torch, "compile"):
+            logger.warning("torch.compile unavailable - denoiser left uncompiled")
+            return
+        if torch.cuda.is_available():
+            torch.backends.cuda.matmul.allow_tf32 = True
+        for name in cls.DENOISER_COMPONENTS:
+            module = getattr(pipe, name, None)
+            if module is not None:
+                setattr(pipe, name, torch.compile(
+                    module, mode="reduce-overhead", fullgraph=False, dynamic=False
+                ))
+
+    @staticmethod
+    def _enable_xformers(pipe: Any) -> None:
+        """Use xformers memory-efficient attention when it is installed."""
+        try:
+            import xformers  # noqa: F401
+        except ImportError:
+            return
+        try:
+            pipe.enable_xformers_memory_efficient_attention()
+        except Exception as e:
+            logger.warning(f"xformers attention unavailable: {e}")
+
+    def _nf4_config(self, repo_id: str) -> Any:
+        """bitsandbytes NF4 config covering the pipeline's denoiser."""
+        import torch
+        from diffusers import AutoPipelineForText2Image
+        from diffusers.quantizers import PipelineQuantizationConfig
+
+        # model_index.json names the components without loading weights
+        index = AutoPipelineForText2Image.load_config(repo_id, cache_dir=str(self.cache_dir))
+        components = [name for name in self.DENOISER_COMPONENTS if name in index]
+
+        return PipelineQuantizationConfig(
+            quant_backend="bitsandbytes_4bit",
+            quant_kwargs={
+                "load_in_4bit": True,
+                "bnb_4bit_quant_type": "nf4",
+                "bnb_4bit_compute_dtype": torch.bfloat16,
+            },
+            components_to_quantize=components,
+        )
+
+    def _quantize_denoiser(self, pipe: Any, quantization: str) -> None:
+        """Quantize the denoiser's weights in place with optimum-quanto."""
+        from optimum.quanto import freeze, qfloat8, qint8, quantize
+
+        weights = qint8 if quantization == "int8" else qfloat8
+        for name in self.DENOISER_COMPONENTS:
+            module = getattr(pipe, name, None)
+            if module is not None:
+                quantize(module, weights=weights, exclude=self.QUANT_EXCLUDE)
+                freeze(module)
+
+    @staticmethod
+    def _component_formats(pipe: Any) -> dict[str, str]:
+        """Weight formats per pipeline component (dtypes and quantized types)."""
+        formats = {}
+        for name, component in pipe.components.items():
+            parameters = getattr(component, "parameters", None)
+            if parameters is None:
+                continue
+            kinds = set()
+            for param in parameters():
+                kind = type(param).__name__
+                kinds.add(str(param.dtype) if kind == "Parameter" else kind)
+            if kinds:
+                formats[name] = ",".join(sorted(kinds))
+        return formats
 
     def load_checkpoint(
         self,
         path: str,
         device: str = "cuda",
-    ) -> dict[str, Any]:
+        lazy: bool = False,
+        prefetch_keys: list[str] | None = None,
+        num_workers: int = 8,
+        keys: list[str] | None = None,
+    ) -> Mapping[str, Any]:
         """Load a safetensors checkpoint.
 
         Args:
             path: Path to .safetensors file
             device: Target device
+            lazy: Return a LazyCheckpoint that loads tensors on access
+            prefetch_keys: Tensors to warm up front in lazy mode; the rest
+                stay accessible on demand. Eager loads ignore it, since
+                they read every requested tensor anyway.
+            num_workers: Threads fetching tensors concurrently in eager
+                mode (1 = serial)
+            keys: Load only these tensors instead of the whole file
+                (eager mode only)
 
         Returns:
-            State dict
+            State dict (a LazyCheckpoint when ``lazy``)
         """
-        try:
-            import torch
-            from safetensors import safe_open
+        if lazy and keys is not None:
+            raise ValueError("keys selects tensors for eager loads; use prefetch_keys with lazy")
 
-            tensors = {}
-            with safe_open(path, framework="pt", device=device) as f:
-                for key in f.keys():
-                    tensors[key] = f.get_tensor(key)
+        try:
+            if lazy:
+                checkpoint = LazyCheckpoint(path, device=device)
+                if prefetch_keys:
+                    checkpoint.prefetch(prefetch_keys)
+                logger.info(f"Opened checkpoint: {path} ({len(checkpoint)} tensors, lazy)")
+                return checkpoint
+
+            if device == "cpu":
+                # Zero-copy views over the mapped file, via the cached index
+                tensors = self._map_tensors(path, keys)
+            elif num_workers <= 1 and keys is None:
+                # Memory-maps the file; pages fault in as tensors are read
+                # rather than going through an intermediate host copy
+                from safetensors.torch import load_file
+
+                tensors = load_file(path, device=device)
+            else:
+                tensors = self._fetch_tensors(path, device, keys, num_workers)
 
             logger.info(f"Loaded checkpoint: {path} ({len(tensors)} tensors)")
             return tensors
@@ -214,32 +752,111 @@ class ModelLoader:
             logger.error("safetensors not installed")
             raise
 
-    def unload(self, model_id: str) -> bool:
-        """Unload a model to free memory."""
-        if model_id in self.loaded_models:
-            del self.loaded_models[model_id]
-
-            # Force garbage collection
-            import gc
-
-            gc.collect()
-
-            try:
-                import torch
-
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-            except ImportError:
-                pass
+    @staticmethod
+    def _map_tensors(path: str, keys: list[str] | None = None) -> dict[str, Any]:
+        """Build CPU tensors directly over a memory map of the file.
 
-            logger.info(f"Unloaded model: {model_id}")
-            return True
-        return False
+        Each tensor is a torch.frombuffer view of its byte range, so loading
+        copies nothing: pages fault in from the page cache on first touch.
+        Files holding a dtype this torch cannot view are loaded through
+        ``safetensors.torch.load_file`` instead.
+        """
+        import mmap
+
+        import torch
+
+        base, index = safetensors_index(path)
+        keys = list(index) if keys is None else keys
+        unknown = {index[key]["dtype"] for key in keys}
+        unknown = sorted(name for name in unknown if _ST_TORCH_DTYPES[name] is None)
+        if unknown:
+            from safetensors.torch import load_file
+
+            logger.info(f"Unmappable dtypes {unknown} in {path}; loading via safetensors")
+            loaded = load_file(path, device="cpu")
+            return {key: loaded[key] for key in keys}
+
+        with open(path, "rb") as f:
+            # Copy-on-write: writable for torch, never written back to disk
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        tensors = MappedStateDict(mm)
+        for key in keys:
+            entry = index[key]
+            dtype = _ST_TORCH_DTYPES[entry["dtype"]]
+            lo, hi = entry["data_offsets"]
+            shape = entry["shape"]
+            if hi == lo:
+                tensors[key] = torch.empty(shape, dtype=dtype)
+                continue
+            itemsize = torch.empty((), dtype=dtype).element_size()
+            tensors[key] = torch.frombuffer(
+                mm, dtype=dtype, count=(hi - lo) // itemsize, offset=base + lo
+            ).view(shape)
+        return tensors
+
+    def _fetch_tensors(
+        self,
+        path: str,
+        device: str,
+        keys: list[str] | None,
+        num_workers: int,
+    ) -> dict[str, Any]:
+        """Fetch tensors from one safe_open handle on a thread pool.
 
-    def unload_all(self) -> int:
-        """Unload all models."""
-        count = len(self.loaded_models)
-        self.loaded_models.clear()
+        Concurrent reads keep the disk busy while other threads copy to the
+        device. For CUDA each thread copies on its own stream so H2D
+        transfers overlap; all streams are synchronized before returning.
+        """
+        import torch
+        from safetensors import safe_open
+
+        streams: list[Any] = []
+        local = threading.local()
+        use_streams = device.startswith("cuda") and torch.cuda.is_available()
+
+        with safe_open(path, framework="pt", device=device) as f:
+            keys = list(f.keys()) if keys is None else keys
+
+            def fetch(key: str) -> Any:
+                if not use_streams:
+                    return f.get_tensor(key)
+                stream = getattr(local, "stream", None)
+                if stream is None:
+                    stream = local.stream = torch.cuda.Stream(device=device)
+                    streams.append(stream)
+                with torch.cuda.stream(stream):
+                    return f.get_tensor(key)
+
+            workers = max(1, min(num_workers, os.cpu_count() or 1, len(keys)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tensors = dict(zip(keys, pool.map(fetch, keys)))
+
+        for stream in streams:
+            stream.synchronize()
+        return tensors
+
+    @staticmethod
+    def _pipeline_mb(pipe: Any) -> int:
+        """Approximate size of a pipeline's parameters and buffers in MB."""
+        nbytes = 0
+        for component in getattr(pipe, "components", {}).values():
+            for getter in ("parameters", "buffers"):
+                tensors = getattr(component, getter, None)
+                if tensors is not None:
+                    nbytes += sum(t.numel() * t.element_size() for t in tensors())
+        return nbytes >> 20
+
+    def _trim_cache(self, force: bool = False) -> None:
+        """Return cached CUDA blocks to the driver once enough has been unloaded.
+
+        Blocks freed by an unload stay in PyTorch's caching allocator, where
+        the next load reuses them without going back to the driver, so the
+        cache is only emptied past EMPTY_CACHE_THRESHOLD_MB (or when forced).
+        """
+        if not force and self._unload_pressure_mb <= self.EMPTY_CACHE_THRESHOLD_MB:
+            return
+        self._unload_pressure_mb = 0
 
         import gc
 
@@ -253,9 +870,47 @@ class ModelLoader:
         except ImportError:
             pass
 
+    def unload(self, model_id: str) -> bool:
+        """Unload a model to free memory."""
+        if model_id in self.loaded_models:
+            pipe = self.loaded_models.pop(model_id)
+            quant = self.quant_meta.pop(model_id, None)
+            self._unload_pressure_mb += self._pipeline_mb(pipe)
+            del pipe
+            self._trim_cache()
+
+            if quant:
+                logger.info(f"Unloaded model: {model_id} (quantized: {quant})")
+            else:
+                logger.info(f"Unloaded model: {model_id}")
+            return True
+        return False
+
+    def unload_all(self) -> int:
+        """Unload all models."""
+        count = len(self.loaded_models)
+        self.loaded_models.clear()
+        self.quant_meta.clear()
+        self._trim_cache(force=True)
+
         logger.info(f"Unloaded {count} models")
         return count
 
+    def close(self) -> None:
+        """Stop background prefetching and unload all models.
+
+        Queued prefetches are cancelled; one already loading finishes on
+        its thread but is not waited for. The loader must not be used
+        afterwards.
+        """
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        with self._pending_lock:
+            # Cancelled prefetches never run, so nothing else pops them
+            for model_id, pending in list(self._pending.items()):
+                if pending.cancelled():
+                    del self._pending[model_id]
+        self.unload_all()
+
 
 # ═══════════════════════════════════════════════════════════════
 #                    INFERENCE HELPER
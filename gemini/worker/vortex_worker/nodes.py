@@ -0,0 +1,106 @@
+"""Built-in executors for VORTEX Worker.
+
+Imported on first use through the ``vortex.executors`` entry points
+(see ExecutorRegistry), not at worker startup.
+"""
+
+import logging
+
+from .executor import AbstractExecutor, ExecutionResult, ExecutorRegistry, TensorHandle
+
+logger = logging.getLogger(__name__)
+
+
+# ═══════════════════════════════════════════════════════════════
+#                    BUILT-IN EXECUTORS
+# ═══════════════════════════════════════════════════════════════
+
+
+@ExecutorRegistry.register("Loader::Checkpoint")
+class CheckpointLoader(AbstractExecutor):
+    """Load a model checkpoint."""
+
+    INPUT_TYPES = {}
+    OUTPUT_TYPES = {"model": "MODEL", "clip": "CLIP", "vae": "VAE"}
+
+    def execute(self, inputs, params) -> ExecutionResult:
+        model_path = params.get("ckpt_name", "")
+        logger.info(f"Loading checkpoint: {model_path}")
+        # Placeholder - actual implementation would load the model
+        return ExecutionResult(
+            success=True,
+            outputs={
+                "model": TensorHandle(0, (), "model"),
+                "clip": TensorHandle(0, (), "clip"),
+                "vae": TensorHandle(0, (), "vae"),
+            },
+            duration_us=0,
+            peak_vram_mb=4096,
+        )
+
+
+@ExecutorRegistry.register("Sampler::KSampler")
+class KSamplerExecutor(AbstractExecutor):
+    """KSampler diffusion sampling."""
+
+    INPUT_TYPES = {
+        "model": "MODEL",
+        "positive": "CONDITIONING",
+        "negative": "CONDITIONING",
+        "latent": "LATENT",
+    }
+    OUTPUT_TYPES = {"samples": "LATENT"}
+
+    def execute(self, inputs, params) -> ExecutionResult:
+        steps = params.get("steps", 20)
+        cfg = params.get("cfg", 7.0)
+        sampler = params.get("sampler_name", "euler")
+        scheduler = params.get("scheduler", "normal")
+
+        logger.info(f"KSampler: steps={steps}, cfg={cfg}, sampler={sampler}")
+
+        # Placeholder - actual implementation would run diffusion
+        return ExecutionResult(
+            success=True,
+            outputs={"samples": TensorHandle(0, (1, 4, 64, 64), "float16")},
+            duration_us=0,
+            peak_vram_mb=2048,
+        )
+
+
+@ExecutorRegistry.register("Decoder::VAE")
+class VAEDecodeExecutor(AbstractExecutor):
+    """VAE decode latents to image."""
+
+    INPUT_TYPES = {"samples": "LATENT", "vae": "VAE"}
+    OUTPUT_TYPES = {"image": "IMAGE"}
+
+    def execute(self, inputs, params) -> ExecutionResult:
+        logger.info("VAE decoding latents to image")
+
+        # Placeholder
+        return ExecutionResult(
+            success=True,
+            outputs={"image": TensorHandle(0, (1, 512, 512, 3), "uint8")},
+            duration_us=0,
+            peak_vram_mb=1024,
+        )
+
+
+@ExecutorRegistry.register("Encoder::CLIP")
+class CLIPTextEncode(AbstractExecutor):
+    """CLIP text encoding for conditioning."""
+
+    INPUT_TYPES = {"clip": "CLIP", "text": "STRING"}
+    OUTPUT_TYPES = {"conditioning": "CONDITIONING"}
+
+    def execute(self, inputs, params) -> ExecutionResult:
+        text = params.get("text", "")
+        logger.info(f"CLIP encoding: {text[:50]}...")
+
+        return ExecutionResult(
+            success=True,
+            outputs={"conditioning": TensorHandle(0, (1, 77, 768), "float16")},
+            duration_us=0,
+            peak_vram_mb=256,
+        )
@@ -4,7 +4,9 @@ Implements seccomp-like security restrictions and import hooks
 to prevent dangerous operations in custom node code.
 """
 
+import ast
 import builtins
+import functools
 import logging
 import sys
 from collections.abc import Callable
@@ -14,19 +16,24 @@ logger = logging.getLogger(__name__)
 
 
 # List of blocked modules (security critical)
-BLOCKED_MODULES: set[str] = {
-    "os",
-    "subprocess",
-    "socket",
-    "multiprocessing",
-    "shutil",
-    "signal",
-    "ctypes",
-    "pty",
-    "pdb",
-    "code",
-    "codeop",
-}
+BLOCKED_MODULES: frozenset[str] = frozenset(
+    {
+        "os",
+        "subprocess",
+        "socket",
+        "multiprocessing",
+        "shutil",
+        "signal",
+        "ctypes",
+        "pty",
+        "pdb",
+        "code",
+        "codeop",
+    }
+)
+
+# Bound membership test, looked up once for the import hot path
+_blocked_contains = BLOCKED_MODULES.__contains__
 
 # List of blocked builtins
 BLOCKED_BUILTINS: set[str] = {
@@ -37,6 +44,56 @@ BLOCKED_BUILTINS: set[str] = {
     "open",
 }
 
+# Statically rejected on top of BLOCKED_MODULES. The runtime import hook
+# cannot block these (the interpreter itself needs them), but user code
+# has no business reaching for them
+_STATIC_BLOCKED_MODULES: frozenset[str] = BLOCKED_MODULES | {"builtins", "importlib", "sys"}
+
+# Builtins that look up or rebind names by string, or drop into a debugger
+REFLECTION_BUILTINS: frozenset[str] = frozenset(
+    {
+        "getattr",
+        "setattr",
+        "delattr",
+        "vars",
+        "globals",
+        "locals",
+        "breakpoint",
+    }
+)
+
+# Attributes rejected whatever the receiver: special attributes that reach
+# interpreter internals, and module or function names that run commands or
+# touch the filesystem. Allowed modules re-export these (``pathlib.os``,
+# ``io.open``), so checking only the receiver name is not enough
+BLOCKED_ATTRIBUTES: frozenset[str] = frozenset(
+    {
+        "__builtins__",
+        "__globals__",
+        "__subclasses__",
+        "__code__",
+        "__closure__",
+        "__import__",
+        "os",
+        "sys",
+        "subprocess",
+        "builtins",
+        "system",
+        "popen",
+        "spawnl",
+        "spawnv",
+        "execv",
+        "execve",
+        "fork",
+        "kill",
+        "open",
+        "remove",
+        "unlink",
+        "rmdir",
+        "rmtree",
+    }
+)
+
 # Original references (saved for restoration)
 _original_import: Callable | None = None
 _original_open: Callable | None = None
@@ -48,13 +105,69 @@ class SecurityViolation(Exception):
     pass
 
 
+class _UnsafeError(Exception):
+    """Internal: stops the AST walk at the first violation."""
+
+
+class _SafetyVisitor(ast.NodeVisitor):
+    """Reject blocked imports, builtins and module attributes.
+
+    Names are checked as references, not only as calls, so aliasing
+    (``f = eval``) or reaching builtins through ``__builtins__`` is caught.
+    The only reflective call allowed is ``getattr`` with a constant,
+    non-dunder attribute name, so names cannot be assembled at runtime.
+    """
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name.partition(".")[0] in _STATIC_BLOCKED_MODULES:
+                raise _UnsafeError(f"import {alias.name}")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.level == 0 and node.module is not None:
+            if node.module.partition(".")[0] in _STATIC_BLOCKED_MODULES:
+                raise _UnsafeError(f"from {node.module} import")
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Name) and func.id == "getattr":
+            name = node.args[1] if len(node.args) > 1 else None
+            if not (
+                isinstance(name, ast.Constant)
+                and isinstance(name.value, str)
+                and not name.value.startswith("__")
+                and name.value not in BLOCKED_ATTRIBUTES
+            ):
+                raise _UnsafeError("getattr with a computed or special name")
+            # Skip the ``getattr`` name itself; check its arguments
+            for child in (*node.args, *node.keywords):
+                self.visit(child)
+            return
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if (
+            node.id in BLOCKED_BUILTINS
+            or node.id in REFLECTION_BUILTINS
+            or node.id == "__builtins__"
+        ):
+            raise _UnsafeError(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if node.attr in BLOCKED_ATTRIBUTES:
+            raise _UnsafeError(f".{node.attr}")
+        if isinstance(node.value, ast.Name) and node.value.id in _STATIC_BLOCKED_MODULES:
+            raise _UnsafeError(f"{node.value.id}.{node.attr}")
+        self.generic_visit(node)
+
+
 class SandboxImportHook:
     """Meta path finder that blocks dangerous imports."""
 
     def find_module(self, fullname: str, path: Any = None):
         """Block imports of dangerous modules."""
-        module_name = fullname.split(".")[0]
-        if module_name in BLOCKED_MODULES:
+        module_name = fullname.partition(".")[0]
+        if _blocked_contains(module_name):
             logger.warning(f"Blocked import attempt: {fullname}")
             raise SecurityViolation(f"Import of '{module_name}' is not allowed")
         return None
@@ -62,8 +175,8 @@ class SandboxImportHook:
 
 def sandboxed_import(name: str, *args, **kwargs):
     """Replacement __import__ that blocks dangerous modules."""
-    module_name = name.split(".")[0]
-    if module_name in BLOCKED_MODULES:
+    module_name = name.partition(".")[0]
+    if _blocked_contains(module_name):
         raise SecurityViolation(f"Import of '{module_name}' is not allowed")
     return _original_import(name, *args, **kwargs)  # type: ignore
 
@@ -134,8 +247,24 @@ def disable_sandbox() -> None:
     logger.info("Security sandbox disabled")
 
 
+@functools.lru_cache(maxsize=256)
+def _find_violation(code: str) -> str | None:
+    """Parse and walk ``code``; returns the first violation, or None."""
+    try:
+        tree = ast.parse(code)
+        _SafetyVisitor().visit(tree)
+    except _UnsafeError as e:
+        return str(e)
+    except (SyntaxError, ValueError, RecursionError) as e:
+        return f"unparseable code ({type(e).__name__})"
+    return None
+
+
 def check_code_safety(code: str) -> bool:
-    """Check if Python code contains dangerous patterns.
+    """Check if Python code uses blocked imports, builtins or attributes.
+
+    The code is parsed rather than scanned as text, so mentions in strings
+    and comments are ignored. Verdicts are cached for repeated submissions.
 
     Args:
         code: Python source code to check
@@ -143,23 +272,9 @@ def check_code_safety(code: str) -> bool:
     Returns:
         True if code appears safe, False otherwise
     """
-    dangerous_patterns = [
-        "os.system",
-        "subprocess",
-        "socket",
-        "exec(",
-        "eval(",
-        "__import__",
-        "open(",
-        "shutil.rmtree",
-        "os.remove",
-        "os.unlink",
-        "os.rmdir",
-    ]
-
-    for pattern in dangerous_patterns:
-        if pattern in code:
-            logger.warning(f"Dangerous pattern detected: {pattern}")
-            return False
+    violation = _find_violation(code)
+    if violation is not None:
+        logger.warning(f"Dangerous code detected: {violation}")
+        return False
 
     return True
@@ -8,6 +8,10 @@ import ctypes
 import mmap
 import time
 
+import numpy as np
+
+from ._atomics import cas_u32, fetch_add_u32, load_u32_acq, store_u32_rel
+
 # ═══════════════════════════════════════════════════════════════
 #                    CTYPES STRUCTURES
 # Must match Rust structs exactly!
@@ -68,6 +72,24 @@ class ShmHeader(ctypes.Structure):
     ]
 
 
+# The same slot layout as a NumPy structured dtype. Field stores through
+# views of this dtype are single typed writes, without the ctypes
+# descriptor lookup per access.
+SLOT_DTYPE = np.dtype([
+    ("pid", "<i4"),
+    ("status", "<u4"),
+    ("last_heartbeat", "<u8"),
+    ("current_job", "<u8"),
+    ("progress", "<f4"),
+    ("reserved", "u1", 36),
+])
+
+# Tensor data begins right after the header and slot table
+_HEADER_SIZE = ctypes.sizeof(ShmHeader)
+
+assert SLOT_DTYPE.itemsize == ctypes.sizeof(WorkerSlot), "SLOT_DTYPE must be 64 bytes"
+
+
 # ═══════════════════════════════════════════════════════════════
 #                    SHM ARENA CLASS
 # ═══════════════════════════════════════════════════════════════
@@ -104,15 +126,18 @@ class ShmArena:
 
         # Cast to header structure
         self.header = ShmHeader.from_buffer(self.mm)
+        base = ctypes.addressof(self.header)
+        self._lock_addr = base + ShmHeader.lock.offset
+        self._num_workers_addr = base + ShmHeader.num_workers.offset
 
         # Initialize if newly created (magic will be 0)
         if self._created and self.header.magic == 0:
             self.header.magic = ShmHeader.MAGIC
             self.header.version = 1
-            self.header.num_workers = 0
             self.header.arena_size = size
             self.header.arena_used = 0
-            self.header.lock = 0
+            store_u32_rel(self._num_workers_addr, 0)
+            store_u32_rel(self._lock_addr, 0)
 
         # Validate magic
         if self.header.magic != ShmHeader.MAGIC:
@@ -121,23 +146,107 @@ class ShmArena:
                 f"expected {ShmHeader.MAGIC:#x}"
             )
 
+        # Structured view over the slot table; the header struct is only
+        # used for initialization and validation above
+        self._slots = np.frombuffer(
+            self.mm,
+            dtype=SLOT_DTYPE,
+            count=ShmHeader.MAX_WORKERS,
+            offset=ShmHeader.slots.offset,
+        )
+        self._status = self._slots["status"]
+        self._last_heartbeat = self._slots["last_heartbeat"]
+        self._progress = self._slots["progress"]
+        # Heartbeats are wall-clock ms derived from the monotonic clock via
+        # one anchor, so NTP steps cannot move them backwards
+        self._wall_anchor_ms = time.time_ns() // 1_000_000 - time.monotonic_ns() // 1_000_000
+        # Last heartbeat ms written per slot, to skip redundant stores
+        self._last_hb: dict[int, int] = {}
+        # Heartbeat views handed out, released on close()
+        self._views: list[memoryview] = []
+
+    @property
+    def base_ptr(self) -> int:
+        """Address of the start of the mapping (the header sits at offset 0)."""
+        return ctypes.addressof(self.header)
+
+    @property
+    def size(self) -> int:
+        """Size of the mapping in bytes."""
+        return len(self.mm)
+
     def close(self) -> None:
-        """Close the shared memory mapping."""
+        """Close the shared memory mapping.
+
+        Views from ``heartbeat_view`` are released and must not be used
+        afterwards. Closing an already closed arena does nothing.
+
+        Raises:
+            BufferError: A tensor from ``TensorExecutor.get_tensor`` still
+                aliases the mapping. The arena is left closable; drop the
+                tensor and call ``close`` again.
+        """
+        if self.mm.closed:
+            return
+        # Drop buffer exports before unmapping
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._status = self._last_heartbeat = self._progress = self._slots = None
+        self.header = None
         self.mm.close()
         self.shm.close_fd()
 
-    def register_worker(self, slot_id: int) -> None:
-        """Register this worker in the given slot."""
+    def register_worker(self, slot_id: int) -> memoryview:
+        """Register this worker in the given slot.
+
+        Returns:
+            A one-element uint64 view over the slot's ``last_heartbeat``
+            field. Assigning ``view[0] = now_ms`` is a single aligned 8-byte
+            store, with no method dispatch or ctypes field access.
+        """
         import os
 
         if slot_id >= ShmHeader.MAX_WORKERS:
             raise ValueError(f"Slot ID {slot_id} exceeds max {ShmHeader.MAX_WORKERS}")
 
-        slot = self.header.slots[slot_id]
-        slot.pid = os.getpid()
-        slot.status = 1  # BOOTING
-        slot.last_heartbeat = int(time.time() * 1000)
-        slot.progress = 0.0
+        slot = self._slots[slot_id]
+        if slot["status"] == 0:  # DEAD: a fresh registration
+            fetch_add_u32(self._num_workers_addr, 1)
+        slot["pid"] = os.getpid()
+        slot["status"] = 1  # BOOTING
+        slot["last_heartbeat"] = self._last_hb[slot_id] = self.now_ms()
+        slot["progress"] = 0.0
+
+        return self.heartbeat_view(slot_id)
+
+    def now_ms(self) -> int:
+        """Current heartbeat timestamp (Unix ms, advancing monotonically)."""
+        return self._wall_anchor_ms + time.monotonic_ns() // 1_000_000
+
+    @property
+    def num_workers(self) -> int:
+        """Number of registered workers."""
+        return load_u32_acq(self._num_workers_addr)
+
+    def try_lock(self) -> bool:
+        """Try to take the header lock without blocking."""
+        return cas_u32(self._lock_addr, 0, 1) == 0
+
+    def unlock(self) -> None:
+        """Release the header lock."""
+        store_u32_rel(self._lock_addr, 0)
+
+    def heartbeat_view(self, slot_id: int) -> memoryview:
+        """Get a uint64 view over a slot's heartbeat timestamp."""
+        offset = (
+            ShmHeader.slots.offset
+            + slot_id * ctypes.sizeof(WorkerSlot)
+            + WorkerSlot.last_heartbeat.offset
+        )
+        view = memoryview(self.mm)[offset:offset + 8].cast("Q")
+        self._views.append(view)
+        return view
 
     def set_status(self, slot_id: int, status: int) -> None:
         """Set worker status.
@@ -149,16 +258,26 @@ class ShmArena:
         - 3: BUSY
         - 4: ERROR
         """
-        self.header.slots[slot_id].status = status
+        self._status[slot_id] = status
 
     def update_heartbeat(self, slot_id: int) -> None:
-        """Update worker heartbeat timestamp."""
-        self.header.slots[slot_id].last_heartbeat = int(time.time() * 1000)
+        """Update worker heartbeat timestamp.
+
+        Calls within the same millisecond as the previous update skip the
+        store, since the value would not change.
+        """
+        now = self._wall_anchor_ms + time.monotonic_ns() // 1_000_000
+        if now != self._last_hb.get(slot_id):
+            self._last_heartbeat[slot_id] = now
+            self._last_hb[slot_id] = now
 
     def set_progress(self, slot_id: int, progress: float) -> None:
         """Set worker job progress (0.0 - 1.0)."""
-        self.header.slots[slot_id].progress = max(0.0, min(1.0, progress))
+        # Inline clamp instead of max()/min() calls; NaN maps to 0.0
+        if not 0.0 <= progress <= 1.0:
+            progress = 1.0 if progress > 1.0 else 0.0
+        self._progress[slot_id] = progress
 
     def get_tensor_offset(self) -> int:
         """Get the offset where tensor data begins."""
-        return ctypes.sizeof(ShmHeader)
+        return _HEADER_SIZE